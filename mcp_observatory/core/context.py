@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from datetime import datetime
+from operator import attrgetter
 from typing import Optional
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 from ..utils.time import utc_now_naive
 
@@ -14,7 +15,11 @@ def _new_id() -> str:
     return str(uuid4())
 
 
-@dataclass
+def _as_uuid(value: Optional[str]) -> Optional[UUID]:
+    return UUID(value) if value is not None else None
+
+
+@dataclass(slots=True)
 class TraceContext:
     """Represents telemetry for a single MCP interaction span."""
 
@@ -80,4 +85,32 @@ class TraceContext:
         self.end_time = utc_now_naive()
 
     def to_dict(self) -> dict:
-        return self.__dict__.copy()
+        return dict(zip(_FIELD_NAMES, _FIELD_GETTER(self)))
+
+    def to_insert_tuple(self) -> tuple:
+        """Return the span as a row in ``mcp_traces`` column order.
+
+        UUID columns are returned as ``uuid.UUID`` so asyncpg sends them in
+        binary form instead of as text for the server to parse.
+        """
+        return (
+            _as_uuid(self.trace_id), _as_uuid(self.span_id), _as_uuid(self.parent_span_id),
+            self.service, self.model, self.tool_name,
+            self.start_time, self.end_time, self.prompt_tokens, self.completion_tokens, self.cost_usd,
+            self.retries, self.fallback_used, self.confidence, self.risk_tier, self.prompt_template_id,
+            self.prompt_hash, self.normalized_prompt_hash, self.answer_hash, self.grounding_score,
+            self.verifier_score, self.self_consistency_score, self.numeric_variance_score,
+            self.tool_claim_mismatch, self.hallucination_risk_score, self.hallucination_risk_level,
+            self.prompt_size_chars, self.is_shadow, _as_uuid(self.shadow_parent_trace_id), self.gate_blocked,
+            self.fallback_type, self.fallback_reason, self.request_id, self.session_id, self.method,
+            self.tool_args_hash, self.tool_criticality, self.policy_decision, self.policy_id,
+            self.policy_version, self.grounding_risk, self.self_consistency_risk,
+            self.numeric_instability_risk, self.tool_mismatch_risk, self.drift_risk,
+            self.composite_risk_score, self.composite_risk_level, self.shadow_disagreement_score,
+            self.shadow_numeric_variance, self.exec_token_id, self.exec_token_ttl_ms, self.exec_token_hash,
+            self.exec_token_verified,
+        )
+
+
+_FIELD_NAMES = tuple(f.name for f in fields(TraceContext))
+_FIELD_GETTER = attrgetter(*_FIELD_NAMES)
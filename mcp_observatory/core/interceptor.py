@@ -5,7 +5,7 @@ from __future__ import annotations
 import hashlib
 import re
 from dataclasses import dataclass
-from typing import Any, Awaitable, Callable, Optional
+from typing import Any, Awaitable, Callable, Mapping, Optional
 from uuid import uuid4
 
 from ..cost.pricing import estimate_cost
@@ -22,12 +22,13 @@ from ..hallucination.signals import (
     compute_numeric_variance_score,
     compute_self_consistency_score,
     detect_tool_claim_mismatch,
+    normalize_inputs,
     normalize_text,
     sha256_hash,
 )
 from ..policy.engine import PolicyConfig, PolicyEngine
 from ..policy.registry import DEFAULT_REGISTRY, ToolRegistry
-from ..policy.types import Decision
+from ..policy.types import Criticality, Decision
 from ..risk.vector import compute_risk_vector
 from ..shadow.lane import schedule_shadow_lane
 from ..token.issuer import TokenIssuer
@@ -36,12 +37,15 @@ from ..utils.hashing import args_hash
 from .tracer import Tracer
 
 ModelCallable = Callable[..., Awaitable[Any]]
-ToolCallable = Callable[..., Awaitable[Any]]
+ToolCallable = Callable[..., Any]
 
 UUID_RE = re.compile(r"\b[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[1-5][0-9a-fA-F]{3}-[89abAB][0-9a-fA-F]{3}-[0-9a-fA-F]{12}\b")
 TIMESTAMP_RE = re.compile(r"\b\d{4}-\d{2}-\d{2}(?:[T\s]\d{2}:\d{2}:\d{2}(?:\.\d+)?)?(?:Z|[+-]\d{2}:?\d{2})?\b")
 NUMBER_RE = re.compile(r"\b\d+(?:\.\d+)?\b")
 
+# Span label per criticality ("low", "medium", "high"), built once.
+_CRITICALITY_LABELS = {c: c.name.lower() for c in Criticality}
+
 
 @dataclass
 class V2Config:
@@ -49,6 +53,9 @@ class V2Config:
 
     enabled: bool = True
     shadow_for_high_risk: bool = True
+    # Route HIGH-criticality irreversible tools with a registered fallback
+    # straight to it, skipping risk scoring and policy evaluation.
+    fast_path_on_block: bool = False
 
 
 class MCPInterceptor:
@@ -89,7 +96,7 @@ class MCPInterceptor:
         self,
         *,
         tool_name: str,
-        tool_args: dict,
+        tool_args: Mapping[str, Any],
         tool_fn: ToolCallable,
         model_answer: str,
         tool_result_summary: Optional[str],
@@ -102,7 +109,11 @@ class MCPInterceptor:
         session_id: Optional[str] = None,
         shadow_answer: Optional[str] = None,
     ) -> Any:
-        """Run end-to-end v2 control plane for a tool invocation."""
+        """Run end-to-end v2 control plane for a tool invocation.
+
+        ``tool_args`` may be any mapping, e.g. a ``MappingProxyType`` hoisted
+        out of a loop; it is never copied or mutated.
+        """
         ctx = self.tracer.start_span(model="tool-execution", tool_name=tool_name)
         ctx.request_id = request_id or str(uuid4())
         ctx.session_id = session_id
@@ -110,6 +121,28 @@ class MCPInterceptor:
         ctx.prompt_template_id = prompt_template_id
         ctx.tool_args_hash = args_hash(tool_args)
 
+        profile = self.tool_registry.get(tool_name)
+        ctx.tool_criticality = _CRITICALITY_LABELS[profile.criticality]
+        if (
+            self.v2_config.fast_path_on_block
+            and profile.criticality >= Criticality.HIGH
+            and profile.irreversible
+            and tool_name in self.fallback_router.routes
+        ):
+            ctx.policy_decision = Decision.BLOCK.value
+            ctx.fallback_used = True
+            ctx.fallback_reason = "fast_path_high_irreversible"
+            result, fallback_type = await self.fallback_router.route(
+                tool_name=tool_name,
+                tool_args=tool_args,
+                reason=ctx.fallback_reason,
+            )
+            ctx.fallback_type = fallback_type
+            self.tracer.end_span(ctx)
+            if self.exporter:
+                await self.exporter.export(ctx)
+            return result
+
         rv = compute_risk_vector(
             prompt=prompt,
             answer=model_answer,
@@ -129,8 +162,6 @@ class MCPInterceptor:
         ctx.composite_risk_level = rv.composite_risk_level
         ctx.risk_tier = rv.composite_risk_level
 
-        profile = self.tool_registry.get(tool_name)
-        ctx.tool_criticality = profile.criticality.value.lower()
         policy = self.policy_engine.evaluate(
             tool_profile=profile,
             composite_risk_score=rv.composite_risk_score,
@@ -179,10 +210,10 @@ class MCPInterceptor:
                     )
                     ctx.fallback_type = fallback_type
                 else:
-                    result = await tool_fn(**tool_args)
+                    result = await self._call_tool(tool_fn, tool_args)
             else:
                 ctx.exec_token_verified = None
-                result = await tool_fn(**tool_args)
+                result = await self._call_tool(tool_fn, tool_args)
 
         self.tracer.end_span(ctx)
         if self.exporter:
@@ -294,26 +325,36 @@ class MCPInterceptor:
         span: Any,
     ) -> None:
         config = self.hallucination_config
+        normalized = normalize_inputs(answer, retrieved_context)
 
         if config.enable_prompt_hash:
             span.prompt_hash = sha256_hash(normalize_text(prompt))
-            span.answer_hash = sha256_hash(normalize_text(answer))
+            span.answer_hash = sha256_hash(normalized.answer_norm)
 
         if config.enable_grounding_score:
-            span.grounding_score = compute_grounding_score(answer, retrieved_context)
+            span.grounding_score = compute_grounding_score(answer, retrieved_context, normalized=normalized)
 
         if config.enable_self_consistency:
             if config.self_consistency_mode in {"inline", "shadow"}:
-                span.self_consistency_score = compute_self_consistency_score(answer, secondary_answer)
+                span.self_consistency_score = compute_self_consistency_score(
+                    answer, secondary_answer, normalized=normalized
+                )
 
         if config.enable_numeric_variance:
             span.numeric_variance_score = compute_numeric_variance_score(answer, secondary_answer)
 
         if config.enable_tool_claim_mismatch:
-            span.tool_claim_mismatch = detect_tool_claim_mismatch(answer, tool_result_summary)
+            span.tool_claim_mismatch = detect_tool_claim_mismatch(answer, tool_result_summary, normalized=normalized)
 
         if config.enable_verifier:
-            span.verifier_score, _reason = await self.verifier.score(prompt, answer, context=retrieved_context)
+            # Verifiers that only match the protocol structurally may lack score_normalized.
+            score_normalized = getattr(self.verifier, "score_normalized", None)
+            if score_normalized is not None:
+                span.verifier_score, _reason = await score_normalized(
+                    prompt, answer, retrieved_context, normalized=normalized
+                )
+            else:
+                span.verifier_score, _reason = await self.verifier.score(prompt, answer, context=retrieved_context)
 
         span.hallucination_risk_score = compute_hallucination_risk_score(
             grounding_score=span.grounding_score,
@@ -324,6 +365,13 @@ class MCPInterceptor:
         )
         span.hallucination_risk_level = risk_level_for_score(span.hallucination_risk_score)
 
+    @staticmethod
+    async def _call_tool(tool_fn: ToolCallable, tool_args: Mapping[str, Any]) -> Any:
+        result = tool_fn(**tool_args)
+        if isinstance(result, Awaitable):
+            result = await result
+        return result
+
     @staticmethod
     def _extract_response_text(response: Any) -> str:
         if isinstance(response, str):
@@ -19,7 +19,7 @@ class RealWorldMCPClient:
     server: RealWorldMCPServer
 
     async def list_scenarios(self) -> list[str]:
-        return await self.server.list_scenarios()
+        return list(self.server.list_scenarios())
 
     async def execute_scenario(self, scenario_name: str) -> dict[str, Any]:
         return await self.server.execute_scenario_by_name(scenario_name)
@@ -7,7 +7,8 @@ import asyncio
 from .server import DemoToolServer
 
 
-async def main() -> None:
+async def main(benchmark: bool = False) -> None:
+    """Run the demo; ``benchmark=True`` races the commit and replay through ``asyncio.gather``."""
     server = DemoToolServer()
     try:
         propose = await server.transfer_funds_propose(amount=100, to="acct_123")
@@ -20,6 +21,15 @@ async def main() -> None:
         proposal_id = propose["proposal_id"]
         commit_token = propose["commit_token"]
 
+        if benchmark:
+            first_commit, replay_commit = await asyncio.gather(
+                server.transfer_funds_commit(proposal_id=proposal_id, commit_token=commit_token, amount=100, to="acct_123"),
+                server.transfer_funds_commit(proposal_id=proposal_id, commit_token=commit_token, amount=100, to="acct_123"),
+            )
+            print("FIRST COMMIT:", first_commit)
+            print("REPLAY COMMIT:", replay_commit)
+            return
+
         first_commit = await server.transfer_funds_commit(
             proposal_id=proposal_id,
             commit_token=commit_token,
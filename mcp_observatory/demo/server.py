@@ -2,16 +2,17 @@
 
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass, field
 
 from mcp_observatory.proposal_commit import CommitTokenManager, CommitVerifier, ToolProposer, create_storage_from_env
 
 
-@dataclass
+@dataclass(slots=True)
 class Ledger:
     """In-memory side effect ledger for demo commit operations."""
 
-    transfers: list[dict] = field(default_factory=list)
+    transfers: deque[dict] = field(default_factory=deque)
 
 
 class DemoToolServer:
@@ -32,6 +33,12 @@ class DemoToolServer:
     async def transfer_funds_propose(self, *, amount: float, to: str) -> dict:
         """Proposal tool: never executes side effects."""
         prompt = f"Transfer {amount} to {to}."
+        if self.storage.is_inmemory:
+            return self.proposer.propose_sync(
+                tool_name="transfer_funds",
+                tool_args={"amount": amount, "to": to},
+                prompt=prompt,
+            )
         return await self.proposer.propose(
             tool_name="transfer_funds",
             tool_args={"amount": amount, "to": to},
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Awaitable, Callable, Dict, Optional
 
 from ..core.context import TraceContext
@@ -11,6 +11,9 @@ from ..hallucination.scoring import clamp01
 
 FallbackCallable = Callable[..., Awaitable[Any]]
 
+# Indexed by (confidence_breached | hallucination_breached << 1).
+_REASONS = ("policy_breach", "low_confidence", "high_hallucination", "low_confidence+high_hallucination")
+
 
 @dataclass(frozen=True)
 class ExecutionTier:
@@ -30,6 +33,10 @@ class TieredExecutionConfig:
     tier_1: ExecutionTier
     tier_2: ExecutionTier
     tier_3: ExecutionTier
+    _by_name: Dict[str, ExecutionTier] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_by_name", {tier.name: tier for tier in (self.tier_1, self.tier_2, self.tier_3)})
 
     @classmethod
     def from_base_cost(
@@ -70,14 +77,12 @@ class TieredExecutionConfig:
 
     def resolve_tier(self, tier_name: str) -> ExecutionTier:
         """Resolve a tier by name."""
-        mapping: Dict[str, ExecutionTier] = {
-            self.tier_1.name: self.tier_1,
-            self.tier_2.name: self.tier_2,
-            self.tier_3.name: self.tier_3,
-        }
-        if tier_name not in mapping:
-            raise ValueError(f"Unknown tier '{tier_name}'. Expected one of: {', '.join(mapping.keys())}.")
-        return mapping[tier_name]
+        try:
+            return self._by_name[tier_name]
+        except KeyError:
+            raise ValueError(
+                f"Unknown tier '{tier_name}'. Expected one of: {', '.join(self._by_name.keys())}."
+            ) from None
 
 
 @dataclass(frozen=True)
@@ -166,12 +171,7 @@ class TieredExecutionEngine:
             )
             return ExecutionResult(response=mcp_result, decision=decision, mcp_span=mcp_span)
 
-        reason_parts: list[str] = []
-        if confidence_breached:
-            reason_parts.append("low_confidence")
-        if hallucination_breached:
-            reason_parts.append("high_hallucination")
-        fallback_reason = "+".join(reason_parts) if reason_parts else "policy_breach"
+        fallback_reason = _REASONS[confidence_breached | (hallucination_breached << 1)]
 
         if deterministic_fallback is None:
             decision = ExecutionDecision(
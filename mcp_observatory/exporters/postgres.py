@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
-from typing import Optional
+import asyncio
+import logging
+from typing import Any, Optional
 
 import asyncpg
 
 from ..core.context import TraceContext
 from .base import Exporter
 
+logger = logging.getLogger(__name__)
 
 INSERT_SQL = """
 INSERT INTO mcp_traces (
@@ -28,13 +31,13 @@ INSERT INTO mcp_traces (
     exec_token_id, exec_token_ttl_ms, exec_token_hash, exec_token_verified
 )
 VALUES (
-    $1::uuid, $2::uuid, $3::uuid, $4, $5, $6,
+    $1, $2, $3, $4, $5, $6,
     $7, $8, $9, $10, $11,
     $12, $13, $14,
     $15, $16, $17, $18, $19,
     $20, $21, $22, $23,
     $24, $25, $26,
-    $27, $28, $29::uuid, $30,
+    $27, $28, $29, $30,
     $31, $32,
     $33, $34, $35, $36, $37,
     $38, $39, $40,
@@ -45,9 +48,35 @@ VALUES (
 )
 """
 
+COLUMNS = (
+    "trace_id", "span_id", "parent_span_id", "service", "model", "tool_name",
+    "start_time", "end_time", "prompt_tokens", "completion_tokens", "cost_usd",
+    "retries", "fallback_used", "confidence",
+    "risk_tier", "prompt_template_id", "prompt_hash", "normalized_prompt_hash", "answer_hash",
+    "grounding_score", "verifier_score", "self_consistency_score", "numeric_variance_score",
+    "tool_claim_mismatch", "hallucination_risk_score", "hallucination_risk_level",
+    "prompt_size_chars", "is_shadow", "shadow_parent_trace_id", "gate_blocked",
+    "fallback_type", "fallback_reason",
+    "request_id", "session_id", "method", "tool_args_hash", "tool_criticality",
+    "policy_decision", "policy_id", "policy_version",
+    "grounding_risk", "self_consistency_risk", "numeric_instability_risk",
+    "tool_mismatch_risk", "drift_risk", "composite_risk_score", "composite_risk_level",
+    "shadow_disagreement_score", "shadow_numeric_variance",
+    "exec_token_id", "exec_token_ttl_ms", "exec_token_hash", "exec_token_verified",
+)
+
 
 class PostgresExporter(Exporter):
-    """Exporter that persists spans into PostgreSQL using ``asyncpg``."""
+    """Exporter that persists spans into PostgreSQL using ``asyncpg``.
+
+    Spans are buffered in memory and written in bulk with ``COPY`` by a
+    background task, either every ``max_interval`` seconds or as soon as
+    ``max_batch`` spans are pending. ``close()`` flushes anything left.
+
+    A failed write keeps its spans and is retried with exponential backoff
+    (``retry_backoff`` up to ``max_retry_backoff`` seconds). The buffer holds
+    at most ``max_buffer`` spans; beyond that the oldest are dropped.
+    """
 
     def __init__(
         self,
@@ -56,46 +85,99 @@ class PostgresExporter(Exporter):
         pool: Optional[asyncpg.Pool] = None,
         min_size: int = 1,
         max_size: int = 10,
+        max_batch: int = 500,
+        max_interval: float = 0.2,
+        max_buffer: int = 10_000,
+        retry_backoff: float = 0.1,
+        max_retry_backoff: float = 5.0,
     ) -> None:
         self._dsn = dsn
         self._pool = pool
         self._min_size = min_size
         self._max_size = max_size
+        self._max_batch = max_batch
+        self._max_interval = max_interval
+        self._max_buffer = max_buffer
+        self._retry_backoff = retry_backoff
+        self._max_retry_backoff = max_retry_backoff
+        self._buffer: list[tuple[Any, ...]] = []
+        self._flush_event = asyncio.Event()
+        self._flush_task: Optional[asyncio.Task] = None
 
     async def connect(self) -> None:
-        if self._pool is not None:
-            return
-        if not self._dsn:
-            raise ValueError("Either `dsn` or `pool` must be provided for PostgresExporter.")
+        if self._pool is None:
+            if not self._dsn:
+                raise ValueError("Either `dsn` or `pool` must be provided for PostgresExporter.")
+            self._pool = await asyncpg.create_pool(
+                dsn=self._dsn,
+                min_size=self._min_size,
+                max_size=self._max_size,
+            )
 
-        self._pool = await asyncpg.create_pool(dsn=self._dsn, min_size=self._min_size, max_size=self._max_size)
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_loop())
 
     async def export(self, context: TraceContext) -> None:
-        if self._pool is None:
+        if self._flush_task is None or self._flush_task.done():
             await self.connect()
 
+        self._buffer.append(context.to_insert_tuple())
+        self._trim_buffer()
+        if len(self._buffer) >= self._max_batch:
+            self._flush_event.set()
+
+    async def flush(self) -> None:
+        """Write all buffered spans to PostgreSQL."""
+        if not self._buffer:
+            return
+        batch, self._buffer = self._buffer, []
+
         assert self._pool is not None
-        p = context.to_dict()
-        async with self._pool.acquire() as conn:
-            await conn.execute(
-                INSERT_SQL,
-                p["trace_id"], p["span_id"], p["parent_span_id"], p["service"], p["model"], p["tool_name"],
-                p["start_time"], p["end_time"], p["prompt_tokens"], p["completion_tokens"], p["cost_usd"],
-                p["retries"], p["fallback_used"], p["confidence"],
-                p["risk_tier"], p["prompt_template_id"], p["prompt_hash"], p["normalized_prompt_hash"], p["answer_hash"],
-                p["grounding_score"], p["verifier_score"], p["self_consistency_score"], p["numeric_variance_score"],
-                p["tool_claim_mismatch"], p["hallucination_risk_score"], p["hallucination_risk_level"],
-                p["prompt_size_chars"], p["is_shadow"], p["shadow_parent_trace_id"], p["gate_blocked"],
-                p["fallback_type"], p["fallback_reason"],
-                p["request_id"], p["session_id"], p["method"], p["tool_args_hash"], p["tool_criticality"],
-                p["policy_decision"], p["policy_id"], p["policy_version"],
-                p["grounding_risk"], p["self_consistency_risk"], p["numeric_instability_risk"],
-                p["tool_mismatch_risk"], p["drift_risk"], p["composite_risk_score"], p["composite_risk_level"],
-                p["shadow_disagreement_score"], p["shadow_numeric_variance"],
-                p["exec_token_id"], p["exec_token_ttl_ms"], p["exec_token_hash"], p["exec_token_verified"],
-            )
+        try:
+            async with self._pool.acquire() as conn:
+                if len(batch) == 1:
+                    await conn.execute(INSERT_SQL, *batch[0])
+                else:
+                    await conn.copy_records_to_table("mcp_traces", records=batch, columns=COLUMNS)
+        except BaseException:
+            # Keep the spans so a later flush (or ``close()``) can retry them.
+            self._buffer[:0] = batch
+            self._trim_buffer()
+            raise
+
+    def _trim_buffer(self) -> None:
+        overflow = len(self._buffer) - self._max_buffer
+        if overflow > 0:
+            del self._buffer[:overflow]
+            logger.warning("PostgresExporter buffer full; dropped %d oldest spans", overflow)
+
+    async def _flush_loop(self) -> None:
+        backoff = self._retry_backoff
+        while True:
+            try:
+                await asyncio.wait_for(self._flush_event.wait(), timeout=self._max_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._flush_event.clear()
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("PostgresExporter flush failed; retrying in %.2fs", backoff)
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, self._max_retry_backoff)
+            else:
+                backoff = self._retry_backoff
 
     async def close(self) -> None:
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+
         if self._pool is not None:
+            await self.flush()
             await self._pool.close()
             self._pool = None
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
-from typing import Any, Awaitable, Callable, Dict, Optional
+from typing import Any, Awaitable, Callable, Dict, Mapping, Optional
 
 from .templates import block_response_template
 
-FallbackCallable = Callable[[dict], Awaitable[Any]]
+# Fallbacks receive the caller's tool_args mapping as-is and must not mutate it.
+FallbackCallable = Callable[[Mapping[str, Any]], Awaitable[Any]]
 
 
 @dataclass
@@ -17,9 +19,11 @@ class FallbackRouter:
     routes: Dict[str, FallbackCallable] = field(default_factory=dict)
 
     def register(self, tool_name: str, fallback_fn: FallbackCallable) -> None:
-        self.routes[tool_name] = fallback_fn
+        # Interned keys let lookups with interned names (literals, identifiers)
+        # match on identity before comparing characters.
+        self.routes[sys.intern(tool_name)] = fallback_fn
 
-    async def route(self, *, tool_name: str, tool_args: dict, reason: str) -> tuple[Any, str]:
+    async def route(self, *, tool_name: str, tool_args: Mapping[str, Any], reason: str) -> tuple[Any, str]:
         fn = self.routes.get(tool_name)
         if fn is None:
             return block_response_template(tool_name, reason), "template"
@@ -2,12 +2,13 @@
 
 from .config import HallucinationConfig
 from .scoring import compute_hallucination_risk_score, risk_level_for_score
-from .signals import LocalHeuristicVerifier, Verifier
+from .signals import LocalHeuristicVerifier, NormalizedInputs, Verifier
 
 __all__ = [
     "HallucinationConfig",
     "Verifier",
     "LocalHeuristicVerifier",
+    "NormalizedInputs",
     "compute_hallucination_risk_score",
     "risk_level_for_score",
 ]
@@ -29,25 +29,35 @@ def compute_hallucination_risk_score(
     w_tool_mismatch: float = 0.10,
 ) -> Optional[float]:
     """Compute weighted hallucination risk score using available components."""
-    components: list[tuple[float, float]] = []
+    if (
+        grounding_score is None
+        and self_consistency_score is None
+        and verifier_score is None
+        and numeric_variance_score is None
+        and tool_claim_mismatch is None
+    ):
+        return None
 
+    # Single running accumulation in component order; max/min inline clamp01.
+    weighted_sum = 0.0
+    total_weight = 0.0
     if grounding_score is not None:
-        components.append((to_risk(grounding_score), w_grounding))
+        weighted_sum += max(0.0, min(1.0, 1.0 - grounding_score)) * w_grounding
+        total_weight += w_grounding
     if self_consistency_score is not None:
-        components.append((to_risk(self_consistency_score), w_consistency))
+        weighted_sum += max(0.0, min(1.0, 1.0 - self_consistency_score)) * w_consistency
+        total_weight += w_consistency
     if verifier_score is not None:
-        components.append((to_risk(verifier_score), w_verifier))
+        weighted_sum += max(0.0, min(1.0, 1.0 - verifier_score)) * w_verifier
+        total_weight += w_verifier
     if numeric_variance_score is not None:
-        components.append((clamp01(numeric_variance_score), w_numeric))
+        weighted_sum += max(0.0, min(1.0, numeric_variance_score)) * w_numeric
+        total_weight += w_numeric
     if tool_claim_mismatch is not None:
-        components.append((1.0 if tool_claim_mismatch else 0.0, w_tool_mismatch))
-
-    if not components:
-        return None
+        weighted_sum += (1.0 if tool_claim_mismatch else 0.0) * w_tool_mismatch
+        total_weight += w_tool_mismatch
 
-    weighted_sum = sum(risk * weight for risk, weight in components)
-    total_weight = sum(weight for _, weight in components)
-    return clamp01(weighted_sum / total_weight)
+    return max(0.0, min(1.0, weighted_sum / total_weight))
 
 
 def risk_level_for_score(score: Optional[float]) -> Optional[str]:
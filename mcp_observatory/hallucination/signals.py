@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import hashlib
 import re
-from statistics import mean
+from dataclasses import dataclass
 from typing import Optional, Protocol
 
 from .scoring import clamp01
@@ -12,15 +12,26 @@ from .scoring import clamp01
 TOKEN_RE = re.compile(r"[a-zA-Z0-9]+")
 NUMBER_RE = re.compile(r"[-+]?\d*\.?\d+")
 
+# Substring matchers (no word boundaries) for the keyword heuristics below.
+FAIL_RE = re.compile(r"failed|error|declined")
+SUCCESS_RE = re.compile(r"completed|success|done|sent")
+HEDGE_RE = re.compile(r"not sure|i think|maybe")
+ABSOLUTE_RE = re.compile(r"definitely|guaranteed")
+
 
 def normalize_text(text: str) -> str:
     """Normalize text by lowercasing and collapsing whitespace."""
     return re.sub(r"\s+", " ", text.strip().lower())
 
 
+def sha256_digest(text: str) -> bytes:
+    """Return raw SHA-256 digest bytes for text; cheaper to compare than hex."""
+    return hashlib.sha256(text.encode("utf-8", "surrogatepass")).digest()
+
+
 def sha256_hash(text: str) -> str:
     """Return SHA-256 hash hex digest for text."""
-    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+    return sha256_digest(text).hex()
 
 
 def tokens(text: str) -> set[str]:
@@ -28,22 +39,60 @@ def tokens(text: str) -> set[str]:
     return set(TOKEN_RE.findall(normalize_text(text)))
 
 
+def jaccard_sets(left_tokens: frozenset[str] | set[str], right_tokens: frozenset[str] | set[str]) -> float:
+    """Compute Jaccard similarity over pre-tokenized sets."""
+    return len(left_tokens & right_tokens) / max(1, len(left_tokens | right_tokens))
+
+
 def jaccard_similarity(left: str, right: str) -> float:
     """Compute Jaccard similarity over token sets."""
-    left_tokens = tokens(left)
-    right_tokens = tokens(right)
-    return len(left_tokens & right_tokens) / max(1, len(left_tokens | right_tokens))
+    return jaccard_sets(tokens(left), tokens(right))
+
+
+@dataclass(frozen=True)
+class NormalizedInputs:
+    """Answer/context normalization shared by every scorer for one span."""
 
+    answer_norm: str
+    answer_tokens: frozenset[str]
+    context_tokens: Optional[frozenset[str]] = None
 
-def compute_self_consistency_score(answer_primary: str, answer_secondary: Optional[str]) -> Optional[float]:
+
+def normalize_inputs(answer: str, retrieved_context: Optional[str] = None) -> NormalizedInputs:
+    """Normalize and tokenize the answer (and context) once per span."""
+    answer_norm = normalize_text(answer)
+    context_tokens = frozenset(tokens(retrieved_context)) if retrieved_context is not None else None
+    return NormalizedInputs(
+        answer_norm=answer_norm,
+        answer_tokens=frozenset(TOKEN_RE.findall(answer_norm)),
+        context_tokens=context_tokens,
+    )
+
+
+def compute_self_consistency_score(
+    answer_primary: str,
+    answer_secondary: Optional[str],
+    *,
+    normalized: Optional[NormalizedInputs] = None,
+) -> Optional[float]:
     """Compute answer self-consistency score when a second answer is available."""
     if answer_secondary is None:
         return None
-    return clamp01(jaccard_similarity(answer_primary, answer_secondary))
+    if normalized is None:
+        return clamp01(jaccard_similarity(answer_primary, answer_secondary))
+    return clamp01(jaccard_sets(normalized.answer_tokens, tokens(answer_secondary)))
 
 
 def _extract_numbers(text: str) -> list[float]:
-    return [float(match.group(0)) for match in NUMBER_RE.finditer(text)]
+    return list(map(float, NUMBER_RE.findall(text)))
+
+
+def _fmean(values: list[float]) -> float:
+    return sum(values) / len(values) if values else 0.0
+
+
+def _relative_diff(a_value: float, b_value: float) -> float:
+    return abs(a_value - b_value) / max(1e-9, abs(a_value))
 
 
 def compute_numeric_variance_score(answer_primary: str, answer_secondary: Optional[str] = None) -> float:
@@ -51,41 +100,58 @@ def compute_numeric_variance_score(answer_primary: str, answer_secondary: Option
     nums_primary = _extract_numbers(answer_primary)
     if answer_secondary is not None:
         nums_secondary = _extract_numbers(answer_secondary)
-        diffs = [
-            abs(a_value - b_value) / max(1e-9, abs(a_value))
-            for a_value, b_value in zip(nums_primary, nums_secondary)
-        ]
+        diffs = list(map(_relative_diff, nums_primary, nums_secondary))
         if not diffs:
             return 0.0
-        return clamp01(mean(diffs))
+        return clamp01(_fmean(diffs))
 
     if len(nums_primary) < 2:
         return 0.0
 
-    spread = (max(nums_primary) - min(nums_primary)) / max(1e-9, abs(mean(nums_primary)))
+    # One pass for min, max and sum instead of three separate reductions.
+    lo = hi = total = nums_primary[0]
+    for value in nums_primary[1:]:
+        total += value
+        if value < lo:
+            lo = value
+        elif value > hi:
+            hi = value
+    spread = (hi - lo) / max(1e-9, abs(total / len(nums_primary)))
     return clamp01(spread)
 
 
-def detect_tool_claim_mismatch(answer: str, tool_result_summary: Optional[str]) -> Optional[bool]:
+def detect_tool_claim_mismatch(
+    answer: str,
+    tool_result_summary: Optional[str],
+    *,
+    normalized: Optional[NormalizedInputs] = None,
+) -> Optional[bool]:
     """Detect mismatch between tool failure and model success claims."""
     if tool_result_summary is None:
         return None
 
-    failed_words = ("failed", "error", "declined")
-    success_words = ("completed", "success", "done", "sent")
+    if FAIL_RE.search(normalize_text(tool_result_summary)) is None:
+        return False
+    answer_norm = normalized.answer_norm if normalized is not None else normalize_text(answer)
+    return SUCCESS_RE.search(answer_norm) is not None
 
-    summary = normalize_text(tool_result_summary)
-    answer_text = normalize_text(answer)
-    has_failure = any(word in summary for word in failed_words)
-    has_success_claim = any(word in answer_text for word in success_words)
-    return has_failure and has_success_claim
 
-
-def compute_grounding_score(answer: str, retrieved_context: Optional[str]) -> Optional[float]:
+def compute_grounding_score(
+    answer: str,
+    retrieved_context: Optional[str],
+    *,
+    normalized: Optional[NormalizedInputs] = None,
+) -> Optional[float]:
     """Compute overlap grounding score against retrieved context."""
     if retrieved_context is None:
         return None
-    return clamp01(jaccard_similarity(answer, retrieved_context))
+    if normalized is None or normalized.context_tokens is None:
+        answer_tokens = tokens(answer)
+        context_tokens: frozenset[str] | set[str] = tokens(retrieved_context)
+    else:
+        answer_tokens = normalized.answer_tokens
+        context_tokens = normalized.context_tokens
+    return clamp01(jaccard_sets(answer_tokens, context_tokens))
 
 
 class Verifier(Protocol):
@@ -94,24 +160,50 @@ class Verifier(Protocol):
     async def score(self, prompt: str, answer: str, context: Optional[str] = None) -> tuple[float, str]:
         """Return verifier goodness score and reason."""
 
+    async def score_normalized(
+        self,
+        prompt: str,
+        answer: str,
+        context: Optional[str] = None,
+        *,
+        normalized: NormalizedInputs,
+    ) -> tuple[float, str]:
+        """Score reusing the span's normalized inputs; defaults to :meth:`score`."""
+        return await self.score(prompt, answer, context)
+
 
-class LocalHeuristicVerifier:
+class LocalHeuristicVerifier(Verifier):
     """A cheap local heuristic verifier with no external dependencies."""
 
     async def score(self, prompt: str, answer: str, context: Optional[str] = None) -> tuple[float, str]:
+        return await self._score(answer, context, None)
+
+    async def score_normalized(
+        self,
+        prompt: str,
+        answer: str,
+        context: Optional[str] = None,
+        *,
+        normalized: NormalizedInputs,
+    ) -> tuple[float, str]:
+        return await self._score(answer, context, normalized)
+
+    async def _score(
+        self, answer: str, context: Optional[str], normalized: Optional[NormalizedInputs]
+    ) -> tuple[float, str]:
         score = 1.0
         reasons: list[str] = []
-        answer_norm = normalize_text(answer)
+        answer_norm = normalized.answer_norm if normalized is not None else normalize_text(answer)
 
-        if any(phrase in answer_norm for phrase in ("not sure", "i think", "maybe")):
+        if HEDGE_RE.search(answer_norm):
             score -= 0.25
             reasons.append("hedging_language")
 
-        if any(phrase in answer_norm for phrase in ("definitely", "guaranteed")):
+        if ABSOLUTE_RE.search(answer_norm):
             score -= 0.25
             reasons.append("absolute_claims")
 
-        grounding_score = compute_grounding_score(answer, context)
+        grounding_score = compute_grounding_score(answer, context, normalized=normalized)
         if grounding_score is not None and grounding_score < 0.10:
             score -= 0.25
             reasons.append("low_grounding")
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from dataclasses import replace
 from typing import Optional
 
 from .core.interceptor import MCPInterceptor, V2Config
@@ -29,11 +30,16 @@ def instrument(
     token_verifier: Optional[TokenVerifier] = None,
     fallback_router: Optional[FallbackRouter] = None,
     v2_config: Optional[V2Config] = None,
+    fast_path_on_block: bool = False,
 ) -> MCPInterceptor:
-    """Create a ready-to-use interceptor for an MCP server."""
-    tracer = Tracer(service=service_name)
+    """Create a ready-to-use interceptor for an MCP server.
+
+    ``fast_path_on_block`` sets :attr:`V2Config.fast_path_on_block`.
+    """
+    if fast_path_on_block:
+        v2_config = replace(v2_config or V2Config(), fast_path_on_block=True)
     return MCPInterceptor(
-        tracer=tracer,
+        tracer=Tracer(service=service_name),
         exporter=exporter,
         hallucination_config=hallucination_config,
         verifier=verifier,
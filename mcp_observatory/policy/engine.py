@@ -20,10 +20,37 @@ class PolicyConfig:
 
 
 class PolicyEngine:
-    """Evaluate tool execution policy results."""
+    """Evaluate tool execution policy results.
+
+    The policy matrix is compiled from ``config`` at construction into a
+    per-criticality table of ``(threshold, result)`` rows, checked in
+    descending threshold order, plus a default result. The six possible
+    ``PolicyResult`` values are frozen and shared across calls.
+    """
 
     def __init__(self, config: Optional[PolicyConfig] = None) -> None:
         self.config = config or PolicyConfig()
+        cfg = self.config
+        pid, pver = cfg.policy_id, cfg.policy_version
+
+        self._R_HIGH_BLOCK = PolicyResult(Decision.BLOCK, "high_criticality_block_threshold", pid, pver, cfg.high_block_threshold, True)
+        self._R_HIGH_REVIEW = PolicyResult(Decision.REVIEW, "high_criticality_review_threshold", pid, pver, cfg.high_review_threshold, True)
+        self._R_HIGH_ALLOW = PolicyResult(Decision.ALLOW, "high_criticality_allow", pid, pver, cfg.high_review_threshold, True)
+        self._R_MEDIUM_REVIEW = PolicyResult(Decision.REVIEW, "medium_criticality_review_threshold", pid, pver, cfg.medium_review_threshold, False)
+        self._R_MEDIUM_ALLOW = PolicyResult(Decision.ALLOW, "medium_criticality_allow", pid, pver, cfg.medium_review_threshold, False)
+        self._R_LOW_ALLOW = PolicyResult(Decision.ALLOW, "low_criticality_allow", pid, pver, 1.0, False)
+
+        self._table: dict[Criticality, tuple[tuple[float, PolicyResult], ...]] = {
+            Criticality.HIGH: (
+                (cfg.high_block_threshold, self._R_HIGH_BLOCK),
+                (cfg.high_review_threshold, self._R_HIGH_REVIEW),
+            ),
+            Criticality.MEDIUM: ((cfg.medium_review_threshold, self._R_MEDIUM_REVIEW),),
+        }
+        self._default: dict[Criticality, PolicyResult] = {
+            Criticality.HIGH: self._R_HIGH_ALLOW,
+            Criticality.MEDIUM: self._R_MEDIUM_ALLOW,
+        }
 
     def evaluate(
         self,
@@ -35,19 +62,7 @@ class PolicyEngine:
     ) -> PolicyResult:
         _ = (risk_tier, context)
         c = tool_profile.criticality
-        s = composite_risk_score
-        cfg = self.config
-
-        if c == Criticality.HIGH:
-            if s >= cfg.high_block_threshold:
-                return PolicyResult(Decision.BLOCK, "high_criticality_block_threshold", cfg.policy_id, cfg.policy_version, cfg.high_block_threshold, True)
-            if s >= cfg.high_review_threshold:
-                return PolicyResult(Decision.REVIEW, "high_criticality_review_threshold", cfg.policy_id, cfg.policy_version, cfg.high_review_threshold, True)
-            return PolicyResult(Decision.ALLOW, "high_criticality_allow", cfg.policy_id, cfg.policy_version, cfg.high_review_threshold, True)
-
-        if c == Criticality.MEDIUM:
-            if s >= cfg.medium_review_threshold:
-                return PolicyResult(Decision.REVIEW, "medium_criticality_review_threshold", cfg.policy_id, cfg.policy_version, cfg.medium_review_threshold, False)
-            return PolicyResult(Decision.ALLOW, "medium_criticality_allow", cfg.policy_id, cfg.policy_version, cfg.medium_review_threshold, False)
-
-        return PolicyResult(Decision.ALLOW, "low_criticality_allow", cfg.policy_id, cfg.policy_version, 1.0, False)
+        for threshold, result in self._table.get(c, ()):
+            if composite_risk_score >= threshold:
+                return result
+        return self._default.get(c, self._R_LOW_ALLOW)
@@ -2,31 +2,60 @@
 
 from __future__ import annotations
 
-from typing import Callable, Dict, Optional, Union
+from types import MappingProxyType
+from typing import Callable, Dict, Mapping, Optional, Union
 
 from .types import Criticality, ToolProfile
 
+_MISS_CACHE_MAX = 1024
+
+# Profiles built by @tool_profile, keyed by their field values. Decorating the
+# same tool again (re-imports, test collection) reuses the object.
+_PROFILE_CACHE: Dict[tuple, ToolProfile] = {}
+
+_CRITICALITY_BY_NAME: Dict[str, Criticality] = {c.name: c for c in Criticality}
+
 
 class ToolRegistry:
-    """In-memory registry for MCP tool profile metadata."""
+    """In-memory registry for MCP tool profile metadata.
+
+    Registration is copy-on-write so ``all()`` can hand out a read-only
+    snapshot without copying; registrations are expected at startup.
+    """
 
     def __init__(self) -> None:
         self._profiles: Dict[str, ToolProfile] = {}
+        self._snapshot: Mapping[str, ToolProfile] = MappingProxyType(self._profiles)
+        self._miss_cache: Dict[str, ToolProfile] = {}
 
     def register(self, profile: ToolProfile) -> None:
-        self._profiles[profile.name] = profile
+        profiles = dict(self._profiles)
+        profiles[profile.name] = profile
+        self._profiles = profiles
+        self._snapshot = MappingProxyType(profiles)
+        self._miss_cache.pop(profile.name, None)
 
     def get(self, tool_name: str) -> ToolProfile:
-        return self._profiles.get(tool_name, ToolProfile(name=tool_name, criticality=Criticality.LOW))
+        profile = self._profiles.get(tool_name)
+        if profile is not None:
+            return profile
+
+        # Unregistered tools get a LOW default profile, built once per name.
+        profile = self._miss_cache.get(tool_name)
+        if profile is None:
+            if len(self._miss_cache) >= _MISS_CACHE_MAX:
+                self._miss_cache.clear()
+            profile = self._miss_cache[tool_name] = ToolProfile(name=tool_name, criticality=Criticality.LOW)
+        return profile
 
-    def all(self) -> Dict[str, ToolProfile]:
-        return dict(self._profiles)
+    def all(self) -> Mapping[str, ToolProfile]:
+        return self._snapshot
 
 
 def _to_criticality(value: Union[str, Criticality]) -> Criticality:
     if isinstance(value, Criticality):
         return value
-    return Criticality[value.upper()]
+    return _CRITICALITY_BY_NAME[value.upper()]
 
 
 def tool_profile(
@@ -44,15 +73,20 @@ def tool_profile(
     effective_registry = registry or DEFAULT_REGISTRY
 
     def decorator(fn: Callable) -> Callable:
-        profile = ToolProfile(
-            name=name or fn.__name__,
-            criticality=_to_criticality(criticality),
-            blast_radius=blast_radius,
-            irreversible=irreversible,
-            regulatory=regulatory,
-            risk_tier=risk_tier,
-        )
-        effective_registry.register(profile)
+        key = (name or fn.__name__, _to_criticality(criticality), blast_radius, irreversible, regulatory, risk_tier)
+        profile = _PROFILE_CACHE.get(key)
+        if profile is None:
+            profile = _PROFILE_CACHE[key] = ToolProfile(
+                name=key[0],
+                criticality=key[1],
+                blast_radius=blast_radius,
+                irreversible=irreversible,
+                regulatory=regulatory,
+                risk_tier=risk_tier,
+            )
+        # Registration copies the profile map; skip it when nothing would change.
+        if effective_registry.all().get(profile.name) != profile:
+            effective_registry.register(profile)
         setattr(fn, "_tool_profile", profile)
         return fn
 
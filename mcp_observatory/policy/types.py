@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from enum import Enum
+from enum import Enum, IntEnum
 from typing import Optional
 
 
@@ -15,15 +15,15 @@ class Decision(str, Enum):
     REVIEW = "REVIEW"
 
 
-class Criticality(str, Enum):
-    """Tool criticality level."""
+class Criticality(IntEnum):
+    """Tool criticality level, ordered so gates can compare (``>= HIGH``)."""
 
-    LOW = "LOW"
-    MEDIUM = "MEDIUM"
-    HIGH = "HIGH"
+    LOW = 0
+    MEDIUM = 1
+    HIGH = 2
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ToolProfile:
     """Risk profile metadata for a tool."""
 
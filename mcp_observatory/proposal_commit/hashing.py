@@ -4,32 +4,50 @@ from __future__ import annotations
 
 import hashlib
 import json
-import re
+from functools import lru_cache
 from typing import Any
 
-_WS_RE = re.compile(r"\s+")
+# json.dumps() builds a new JSONEncoder on every call when given non-default
+# options; one shared, preconfigured encoder skips that setup.
+_CANONICAL_ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
 
 
 def canonical_json(value: Any) -> str:
     """Return stable compact JSON with sorted keys for hashing."""
-    return json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return _CANONICAL_ENCODER.encode(value)
 
 
 def sha256_hex(value: str) -> str:
     """Return SHA-256 hex digest for text value."""
-    return hashlib.sha256(value.encode("utf-8")).hexdigest()
+    # Content fingerprint, not a security primitive (tokens are HMAC-signed).
+    return hashlib.sha256(value.encode("utf-8"), usedforsecurity=False).hexdigest()
 
 
 def normalize_prompt(prompt: str) -> str:
     """Normalize prompt text before hashing."""
-    return _WS_RE.sub(" ", prompt.strip().lower())
+    return " ".join(prompt.lower().split())
+
+
+@lru_cache(maxsize=4096)
+def _cached_args_hash(args_json: str) -> str:
+    return sha256_hex(args_json)
+
+
+@lru_cache(maxsize=2048)
+def _cached_prompt_hash(normalized_prompt: str) -> str:
+    return sha256_hex(normalized_prompt)
+
+
+def args_json_hash(args_json: str) -> str:
+    """Hash tool arguments already serialized with :func:`canonical_json`."""
+    return _cached_args_hash(args_json)
 
 
 def tool_args_hash(tool_args: dict[str, Any]) -> str:
     """Compute stable hash for tool arguments."""
-    return sha256_hex(canonical_json(tool_args))
+    return _cached_args_hash(canonical_json(tool_args))
 
 
 def prompt_hash(prompt: str) -> str:
     """Compute normalized prompt hash."""
-    return sha256_hex(normalize_prompt(prompt))
+    return _cached_prompt_hash(normalize_prompt(prompt))
@@ -6,9 +6,9 @@ from dataclasses import dataclass
 from typing import Any, Optional
 from uuid import uuid4
 
-from .hashing import canonical_json, prompt_hash, tool_args_hash
-from .scoring import composite_score, model_generate, numeric_variance, output_instability, prompt_drift
-from .storage import ProposalCommitStorage, utc_now
+from .hashing import args_json_hash, canonical_json, prompt_hash
+from .scoring import composite_score, model_generate, signals_for
+from .storage import InMemoryStorage, ProposalCommitStorage, utc_now
 from .token import CommitTokenManager
 
 
@@ -32,6 +32,8 @@ class ToolProposer:
         self.storage = storage
         self.token_manager = token_manager
         self.config = config or ProposalConfig()
+        # tool_name -> (last prompt, its prompt_hash); agents often repeat prompts.
+        self._last_prompt_cache: dict[str, tuple[str, str]] = {}
 
     async def propose(
         self,
@@ -49,26 +51,74 @@ class ToolProposer:
         - deterministic blocked response with draft action
         """
         args_json = canonical_json(tool_args)
-        args_digest = tool_args_hash(tool_args)
+        args_digest = args_json_hash(args_json)
+
+        async with self.storage.transaction():
+            baseline = await self.storage.get_baseline_prompt_hash(tool_name)
+            p_hash = self._prompt_hash(tool_name, prompt)
+            if baseline is None:
+                await self.storage.set_baseline_prompt_hash(tool_name, p_hash)
+
+            signals, score, decision = self._evaluate(
+                prompt=prompt,
+                p_hash=p_hash,
+                baseline=baseline,
+                candidate_output_a=candidate_output_a,
+                candidate_output_b=candidate_output_b,
+            )
+
+            proposal_id = str(uuid4())
+            await self.storage.save_proposal(
+                proposal_id=proposal_id,
+                tool_name=tool_name,
+                args_json=args_json,
+                prompt_hash=p_hash,
+                composite_score=score,
+                decision=decision,
+                created_at=utc_now(),
+            )
+        return self._response(
+            proposal_id=proposal_id,
+            tool_name=tool_name,
+            tool_args=tool_args,
+            args_digest=args_digest,
+            signals=signals,
+            score=score,
+            decision=decision,
+        )
 
-        baseline = await self.storage.get_baseline_prompt_hash(tool_name)
-        p_hash = prompt_hash(prompt)
-        if baseline is None:
-            await self.storage.set_baseline_prompt_hash(tool_name, p_hash)
+    def propose_sync(
+        self,
+        *,
+        tool_name: str,
+        tool_args: dict[str, Any],
+        prompt: str,
+        candidate_output_a: Optional[str] = None,
+        candidate_output_b: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """Synchronous :meth:`propose` for in-memory storage, which never suspends."""
+        storage = self.storage
+        if not isinstance(storage, InMemoryStorage):
+            raise TypeError("propose_sync requires an in-memory storage backend.")
 
-        out_a = candidate_output_a if candidate_output_a is not None else model_generate(prompt, temperature=0.0)
-        out_b = candidate_output_b if candidate_output_b is not None else model_generate(prompt, temperature=0.7)
+        args_json = canonical_json(tool_args)
+        args_digest = args_json_hash(args_json)
 
-        signals = {
-            "output_instability": output_instability(out_a, out_b),
-            "numeric_variance": numeric_variance(out_a, out_b),
-            "prompt_drift": prompt_drift(prompt, baseline),
-        }
-        score = composite_score(signals)
+        baseline = storage.get_baseline_prompt_hash_sync(tool_name)
+        p_hash = self._prompt_hash(tool_name, prompt)
+        if baseline is None:
+            storage.set_baseline_prompt_hash_sync(tool_name, p_hash)
+
+        signals, score, decision = self._evaluate(
+            prompt=prompt,
+            p_hash=p_hash,
+            baseline=baseline,
+            candidate_output_a=candidate_output_a,
+            candidate_output_b=candidate_output_b,
+        )
 
         proposal_id = str(uuid4())
-        decision = "allow" if score < self.config.block_threshold else "block"
-        await self.storage.save_proposal(
+        storage.save_proposal_sync(
             proposal_id=proposal_id,
             tool_name=tool_name,
             args_json=args_json,
@@ -77,7 +127,52 @@ class ToolProposer:
             decision=decision,
             created_at=utc_now(),
         )
+        return self._response(
+            proposal_id=proposal_id,
+            tool_name=tool_name,
+            tool_args=tool_args,
+            args_digest=args_digest,
+            signals=signals,
+            score=score,
+            decision=decision,
+        )
 
+    def _prompt_hash(self, tool_name: str, prompt: str) -> str:
+        cached = self._last_prompt_cache.get(tool_name)
+        if cached is not None and cached[0] == prompt:
+            return cached[1]
+        p_hash = prompt_hash(prompt)
+        self._last_prompt_cache[tool_name] = (prompt, p_hash)
+        return p_hash
+
+    def _evaluate(
+        self,
+        *,
+        prompt: str,
+        p_hash: str,
+        baseline: Optional[str],
+        candidate_output_a: Optional[str],
+        candidate_output_b: Optional[str],
+    ) -> tuple[dict[str, Optional[float]], float, str]:
+        out_a = candidate_output_a if candidate_output_a is not None else model_generate(prompt, temperature=0.0)
+        out_b = candidate_output_b if candidate_output_b is not None else model_generate(prompt, temperature=0.7)
+
+        signals = signals_for(out_a, out_b, baseline, prompt, prompt_digest=p_hash)
+        score = composite_score(signals)
+        decision = "allow" if score < self.config.block_threshold else "block"
+        return signals, score, decision
+
+    def _response(
+        self,
+        *,
+        proposal_id: str,
+        tool_name: str,
+        tool_args: dict[str, Any],
+        args_digest: str,
+        signals: dict[str, Optional[float]],
+        score: float,
+        decision: str,
+    ) -> dict[str, Any]:
         if decision == "block":
             return {
                 "status": "blocked",
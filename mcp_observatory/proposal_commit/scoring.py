@@ -3,12 +3,11 @@
 from __future__ import annotations
 
 import re
-from statistics import mean
 from typing import Optional
 
+from ..utils.text import word_tokens
 from .hashing import prompt_hash
 
-_TOKEN_RE = re.compile(r"\b\w+\b")
 _NUM_RE = re.compile(r"[-+]?\d*\.?\d+")
 
 
@@ -19,24 +18,26 @@ DEFAULT_WEIGHTS = {
 }
 
 
-def _tokens(text: str) -> set[str]:
-    return set(_TOKEN_RE.findall(text.lower()))
+def _jaccard_sets(aset: set[str], bset: set[str]) -> float:
+    if not aset and not bset:
+        return 1.0
+    # |A ∪ B| = |A| + |B| - |A ∩ B|: only the (smaller) intersection set is built.
+    inter = len(aset & bset)
+    return inter / (len(aset) + len(bset) - inter)
 
 
 def jaccard_similarity(a: str, b: str) -> float:
     """Jaccard similarity on token sets."""
-    aset, bset = _tokens(a), _tokens(b)
-    if not aset and not bset:
-        return 1.0
-    union = aset | bset
-    if not union:
-        return 1.0
-    return len(aset & bset) / len(union)
+    return _jaccard_sets(word_tokens(a), word_tokens(b))
+
+
+def _instability(aset: set[str], bset: set[str]) -> float:
+    return max(0.0, min(1.0, 1.0 - _jaccard_sets(aset, bset)))
 
 
 def output_instability(a: str, b: str) -> float:
     """Instability is 1 - jaccard similarity."""
-    return max(0.0, min(1.0, 1.0 - jaccard_similarity(a, b)))
+    return _instability(word_tokens(a), word_tokens(b))
 
 
 def _numbers(text: str) -> list[float]:
@@ -49,26 +50,28 @@ def _numbers(text: str) -> list[float]:
     return out
 
 
-def numeric_variance(a: str, b: Optional[str] = None) -> Optional[float]:
-    """Compute normalized numeric variance from one or two outputs."""
-    nums_a = _numbers(a)
+def _variance(nums_a: list[float], nums_b: Optional[list[float]]) -> Optional[float]:
     if not nums_a:
         return None
 
-    if b is not None:
-        nums_b = _numbers(b)
-        n = min(len(nums_a), len(nums_b))
-        if n == 0:
+    if nums_b is not None:
+        if not nums_b:
             return 1.0
-        diffs = [abs(nums_a[i] - nums_b[i]) / max(1e-9, abs(nums_a[i])) for i in range(n)]
-        return max(0.0, min(1.0, mean(diffs)))
+        # zip() stops at the shorter list, matching the pairwise comparison.
+        diffs = [abs(x - y) / max(1e-9, abs(x)) for x, y in zip(nums_a, nums_b)]
+        return max(0.0, min(1.0, sum(diffs) / len(diffs)))
 
     if len(nums_a) < 2:
         return 0.0
-    spread = (max(nums_a) - min(nums_a)) / max(1e-9, abs(mean(nums_a)))
+    spread = (max(nums_a) - min(nums_a)) / max(1e-9, abs(sum(nums_a) / len(nums_a)))
     return max(0.0, min(1.0, spread))
 
 
+def numeric_variance(a: str, b: Optional[str] = None) -> Optional[float]:
+    """Compute normalized numeric variance from one or two outputs."""
+    return _variance(_numbers(a), _numbers(b) if b is not None else None)
+
+
 def prompt_drift(prompt: str, baseline_hash: Optional[str]) -> Optional[float]:
     """Return 1.0 if prompt hash differs from baseline, else 0.0."""
     if baseline_hash is None:
@@ -76,6 +79,33 @@ def prompt_drift(prompt: str, baseline_hash: Optional[str]) -> Optional[float]:
     return 0.0 if prompt_hash(prompt) == baseline_hash else 1.0
 
 
+def signals_for(
+    a: str,
+    b: str,
+    baseline_hash: Optional[str],
+    prompt: str,
+    *,
+    prompt_digest: Optional[str] = None,
+) -> dict[str, Optional[float]]:
+    """Compute all proposal signals, tokenizing each candidate output once.
+
+    Pass ``prompt_digest`` when the caller already hashed ``prompt``.
+    """
+    tokens_a, nums_a = word_tokens(a), _numbers(a)
+    tokens_b, nums_b = word_tokens(b), _numbers(b)
+    if baseline_hash is None:
+        drift = None
+    elif prompt_digest is not None:
+        drift = 0.0 if prompt_digest == baseline_hash else 1.0
+    else:
+        drift = prompt_drift(prompt, baseline_hash)
+    return {
+        "output_instability": _instability(tokens_a, tokens_b),
+        "numeric_variance": _variance(nums_a, nums_b),
+        "prompt_drift": drift,
+    }
+
+
 def composite_score(signals: dict[str, Optional[float]], weights: Optional[dict[str, float]] = None) -> float:
     """Weighted renormalized composite score over available signals."""
     w = weights or DEFAULT_WEIGHTS
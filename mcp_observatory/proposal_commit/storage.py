@@ -2,14 +2,22 @@
 
 from __future__ import annotations
 
+import asyncio
+import heapq
 import json
+import logging
 import os
+import time
 from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from datetime import datetime, timezone
-from typing import Any, Optional
+from typing import Any, AsyncIterator, Optional
 
 import asyncpg
 
+logger = logging.getLogger(__name__)
+
 
 def utc_now() -> datetime:
     return datetime.now(timezone.utc)
@@ -18,6 +26,13 @@ def utc_now() -> datetime:
 class ProposalCommitStorage(ABC):
     """Abstract storage backend for proposals, commits and nonce replay checks."""
 
+    is_inmemory: bool = False
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[None]:
+        """Group storage calls into one unit of work; a no-op unless overridden."""
+        yield
+
     @abstractmethod
     async def get_baseline_prompt_hash(self, tool_name: str) -> Optional[str]:
         """Fetch baseline prompt hash configured for a tool."""
@@ -58,119 +73,292 @@ class ProposalCommitStorage(ABC):
         """Persist commit row."""
 
     @abstractmethod
-    async def nonce_seen(self, nonce: str, token_id: str, expires_at: datetime) -> bool:
+    async def nonce_seen(self, nonce: str, token_id: str, expires_at_epoch: int) -> bool:
         """Return True if nonce was already seen and active; otherwise store it and return False."""
 
 
 class InMemoryStorage(ProposalCommitStorage):
     """In-memory storage fallback backend."""
 
+    is_inmemory = True
+
     def __init__(self) -> None:
         self.baseline: dict[str, str] = {}
         self.proposals: dict[str, dict[str, Any]] = {}
         self.commits: dict[str, dict[str, Any]] = {}
-        self.nonces: dict[str, tuple[str, datetime]] = {}
+        self.nonces: dict[str, tuple[str, int]] = {}
+        self._expiry_heap: list[tuple[int, str]] = []
 
-    async def get_baseline_prompt_hash(self, tool_name: str) -> Optional[str]:
+    def get_baseline_prompt_hash_sync(self, tool_name: str) -> Optional[str]:
         return self.baseline.get(tool_name)
 
-    async def set_baseline_prompt_hash(self, tool_name: str, prompt_hash: str) -> None:
+    def set_baseline_prompt_hash_sync(self, tool_name: str, prompt_hash: str) -> None:
         self.baseline[tool_name] = prompt_hash
 
-    async def save_proposal(self, **kwargs: Any) -> None:
+    def save_proposal_sync(self, **kwargs: Any) -> None:
         self.proposals[kwargs["proposal_id"]] = dict(kwargs)
 
+    async def get_baseline_prompt_hash(self, tool_name: str) -> Optional[str]:
+        return self.get_baseline_prompt_hash_sync(tool_name)
+
+    async def set_baseline_prompt_hash(self, tool_name: str, prompt_hash: str) -> None:
+        self.set_baseline_prompt_hash_sync(tool_name, prompt_hash)
+
+    async def save_proposal(self, **kwargs: Any) -> None:
+        self.save_proposal_sync(**kwargs)
+
     async def get_proposal(self, proposal_id: str) -> Optional[dict[str, Any]]:
         return self.proposals.get(proposal_id)
 
     async def save_commit(self, **kwargs: Any) -> None:
         self.commits[kwargs["commit_id"]] = dict(kwargs)
 
-    async def nonce_seen(self, nonce: str, token_id: str, expires_at: datetime) -> bool:
-        now = utc_now()
-        expired = [k for k, (_, exp) in self.nonces.items() if exp <= now]
-        for key in expired:
-            self.nonces.pop(key, None)
+    async def nonce_seen(self, nonce: str, token_id: str, expires_at_epoch: int) -> bool:
+        now = time.time()
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            exp, key = heapq.heappop(heap)
+            entry = self.nonces.get(key)
+            # Skip stale heap entries for nonces re-stored with a later expiry.
+            if entry is not None and entry[1] == exp:
+                del self.nonces[key]
 
         if nonce in self.nonces:
             return True
-        self.nonces[nonce] = (token_id, expires_at)
+        self.nonces[nonce] = (token_id, expires_at_epoch)
+        heapq.heappush(heap, (expires_at_epoch, nonce))
         return False
 
 
-class PostgresStorage(ProposalCommitStorage):
-    """Postgres-backed storage using asyncpg."""
+GET_BASELINE_SQL = "SELECT prompt_hash FROM tool_prompt_baselines WHERE tool_name=$1"
 
-    def __init__(self, dsn: str) -> None:
+SET_BASELINE_SQL = """
+INSERT INTO tool_prompt_baselines (tool_name, prompt_hash)
+VALUES ($1, $2)
+ON CONFLICT (tool_name) DO UPDATE SET prompt_hash = EXCLUDED.prompt_hash
+"""
+
+SAVE_PROPOSAL_SQL = """
+INSERT INTO proposals (proposal_id, tool_name, args_json, prompt_hash, composite_score, decision, created_at)
+VALUES ($1, $2, $3::jsonb, $4, $5, $6, $7)
+"""
+
+GET_PROPOSAL_SQL = "SELECT * FROM proposals WHERE proposal_id=$1"
+
+SAVE_COMMIT_SQL = """
+INSERT INTO commits (commit_id, proposal_id, token_id, decision, verification_reason, created_at)
+VALUES ($1, $2, $3, $4, $5, $6)
+"""
+
+# Claims a nonce in one round trip. An existing row only blocks the insert
+# while it is still active; an expired row is overwritten in place, so the
+# expired-row DELETE can run off the hot path.
+NONCE_CLAIM_SQL = """
+INSERT INTO nonces (nonce, token_id, expires_at)
+VALUES ($1, $2, to_timestamp($3::bigint))
+ON CONFLICT (nonce) DO UPDATE
+    SET token_id = EXCLUDED.token_id, expires_at = EXCLUDED.expires_at
+    WHERE nonces.expires_at <= NOW()
+RETURNING 1
+"""
+
+class PostgresStorage(ProposalCommitStorage):
+    """Postgres-backed storage using asyncpg.
+
+    Proposal rows are write-behind: they are buffered in memory and inserted
+    in batches by a background task, which wakes when a proposal is queued and
+    waits up to ``write_interval`` seconds for ``write_batch`` rows to gather.
+    ``get_proposal`` answers from the pending buffer first, and ``close()``
+    flushes what is left. A proposal that has not been flushed is lost if the
+    process dies; it can only gate a commit made by this same process.
+
+    Commit rows are written synchronously, because they audit side effects
+    that have already happened.
+
+    A batch that fails on a connection error is kept and retried with
+    exponential backoff. A batch rejected for its data (a duplicate
+    ``proposal_id``, say) is retried row by row; rows that still fail are
+    logged and moved to ``rejected_proposals`` so they cannot stall the rows
+    queued behind them.
+    """
+
+    def __init__(
+        self,
+        dsn: str,
+        *,
+        nonce_purge_interval: float = 30.0,
+        write_batch: int = 100,
+        write_interval: float = 0.005,
+        retry_backoff: float = 0.1,
+        max_retry_backoff: float = 5.0,
+    ) -> None:
         self.dsn = dsn
         self.pool: asyncpg.Pool | None = None
+        self.nonce_purge_interval = nonce_purge_interval
+        self.write_batch = write_batch
+        self.write_interval = write_interval
+        self.retry_backoff = retry_backoff
+        self.max_retry_backoff = max_retry_backoff
+        self.rejected_proposals: list[dict[str, Any]] = []
+        self._purge_task: Optional[asyncio.Task] = None
+        self._pending_proposals: dict[str, dict[str, Any]] = {}
+        self._inflight_proposals: dict[str, dict[str, Any]] = {}
+        # One flush at a time, so ``_inflight_proposals`` always belongs to the
+        # batch being written and rows reach Postgres in the order they queued.
+        self._flush_lock = asyncio.Lock()
+        self._flush_event = asyncio.Event()
+        self._flush_task: Optional[asyncio.Task] = None
+        self._conn_var: ContextVar[Optional[asyncpg.Connection]] = ContextVar("pg_storage_conn", default=None)
 
     async def connect(self) -> None:
         if self.pool is None:
-            self.pool = await asyncpg.create_pool(dsn=self.dsn, min_size=1, max_size=4)
+            self.pool = await asyncpg.create_pool(
+                dsn=self.dsn,
+                min_size=1,
+                max_size=4,
+            )
+        if self._purge_task is None or self._purge_task.done():
+            self._purge_task = asyncio.create_task(self._purge_expired_nonces())
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_loop())
 
     async def close(self) -> None:
+        for task in (self._purge_task, self._flush_task):
+            if task is None:
+                continue
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._purge_task = None
+        self._flush_task = None
         if self.pool is not None:
+            await self.flush()
             await self.pool.close()
             self.pool = None
 
-    async def get_baseline_prompt_hash(self, tool_name: str) -> Optional[str]:
+    async def flush(self) -> None:
+        """Write all buffered proposal rows to Postgres."""
+        async with self._flush_lock:
+            if not self._pending_proposals:
+                return
+            proposals, self._pending_proposals = self._pending_proposals, {}
+            # Still visible to ``get_proposal`` while the write is in flight.
+            self._inflight_proposals = proposals
+
+            assert self.pool is not None
+            try:
+                async with self.pool.acquire() as conn:
+                    try:
+                        async with conn.transaction():
+                            await conn.executemany(SAVE_PROPOSAL_SQL, [_proposal_row(p) for p in proposals.values()])
+                    except (asyncpg.IntegrityConstraintViolationError, asyncpg.DataError):
+                        await self._insert_one_by_one(conn, proposals)
+            except BaseException:
+                # Keep the rows so a later flush (or ``close()``) can retry them.
+                self._pending_proposals = {**proposals, **self._pending_proposals}
+                raise
+            finally:
+                self._inflight_proposals = {}
+
+    async def _insert_one_by_one(self, conn: asyncpg.Connection, proposals: dict[str, dict[str, Any]]) -> None:
+        # Written rows are removed from ``proposals`` as we go, so a connection
+        # error part-way through only puts the unwritten ones back.
+        for proposal_id in list(proposals):
+            try:
+                await conn.execute(SAVE_PROPOSAL_SQL, *_proposal_row(proposals[proposal_id]))
+            except (asyncpg.IntegrityConstraintViolationError, asyncpg.DataError) as exc:
+                logger.error("Rejected proposal %s: %s", proposal_id, exc)
+                self.rejected_proposals.append(proposals[proposal_id])
+            del proposals[proposal_id]
+
+    async def _flush_loop(self) -> None:
+        backoff = self.retry_backoff
+        while True:
+            await self._flush_event.wait()
+            if len(self._pending_proposals) < self.write_batch:
+                await asyncio.sleep(self.write_interval)
+            self._flush_event.clear()
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("Proposal flush failed; retrying in %.2fs", backoff)
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, self.max_retry_backoff)
+                self._flush_event.set()
+            else:
+                backoff = self.retry_backoff
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[None]:
+        """Run the enclosed storage calls on one pooled connection and transaction.
+
+        Nested use joins the outer transaction.
+        """
+        if self._conn_var.get() is not None:
+            yield
+            return
         await self.connect()
         assert self.pool is not None
         async with self.pool.acquire() as conn:
-            row = await conn.fetchrow("SELECT prompt_hash FROM tool_prompt_baselines WHERE tool_name=$1", tool_name)
-            return row["prompt_hash"] if row else None
-
-    async def set_baseline_prompt_hash(self, tool_name: str, prompt_hash: str) -> None:
+            async with conn.transaction():
+                token = self._conn_var.set(conn)
+                try:
+                    yield
+                finally:
+                    self._conn_var.reset(token)
+
+    @asynccontextmanager
+    async def _connection(self) -> AsyncIterator[asyncpg.Connection]:
+        conn = self._conn_var.get()
+        if conn is not None:
+            yield conn
+            return
         await self.connect()
         assert self.pool is not None
         async with self.pool.acquire() as conn:
-            await conn.execute(
-                """
-                INSERT INTO tool_prompt_baselines (tool_name, prompt_hash)
-                VALUES ($1, $2)
-                ON CONFLICT (tool_name) DO UPDATE SET prompt_hash = EXCLUDED.prompt_hash
-                """,
-                tool_name,
-                prompt_hash,
-            )
+            yield conn
+
+    async def _purge_expired_nonces(self) -> None:
+        while True:
+            await asyncio.sleep(self.nonce_purge_interval)
+            assert self.pool is not None
+            try:
+                async with self.pool.acquire() as conn:
+                    await conn.execute("DELETE FROM nonces WHERE expires_at <= NOW()")
+            except (asyncpg.PostgresError, OSError):
+                # Purging is housekeeping only; retry on the next tick.
+                continue
+
+    async def get_baseline_prompt_hash(self, tool_name: str) -> Optional[str]:
+        async with self._connection() as conn:
+            row = await conn.fetchrow(GET_BASELINE_SQL, tool_name)
+            return row["prompt_hash"] if row else None
+
+    async def set_baseline_prompt_hash(self, tool_name: str, prompt_hash: str) -> None:
+        async with self._connection() as conn:
+            await conn.execute(SET_BASELINE_SQL, tool_name, prompt_hash)
 
     async def save_proposal(self, **kwargs: Any) -> None:
         await self.connect()
-        assert self.pool is not None
-        async with self.pool.acquire() as conn:
-            await conn.execute(
-                """
-                INSERT INTO proposals (proposal_id, tool_name, args_json, prompt_hash, composite_score, decision, created_at)
-                VALUES ($1, $2, $3::jsonb, $4, $5, $6, $7)
-                """,
-                kwargs["proposal_id"],
-                kwargs["tool_name"],
-                kwargs["args_json"],
-                kwargs["prompt_hash"],
-                kwargs["composite_score"],
-                kwargs["decision"],
-                kwargs["created_at"],
-            )
+        self._pending_proposals[kwargs["proposal_id"]] = kwargs
+        self._flush_event.set()
 
     async def get_proposal(self, proposal_id: str) -> Optional[dict[str, Any]]:
-        await self.connect()
-        assert self.pool is not None
-        async with self.pool.acquire() as conn:
-            row = await conn.fetchrow("SELECT * FROM proposals WHERE proposal_id=$1", proposal_id)
+        pending = self._pending_proposals.get(proposal_id) or self._inflight_proposals.get(proposal_id)
+        if pending is not None:
+            return dict(pending)
+        async with self._connection() as conn:
+            row = await conn.fetchrow(GET_PROPOSAL_SQL, proposal_id)
             if row is None:
                 return None
             return dict(row)
 
     async def save_commit(self, **kwargs: Any) -> None:
-        await self.connect()
-        assert self.pool is not None
-        async with self.pool.acquire() as conn:
+        async with self._connection() as conn:
             await conn.execute(
-                """
-                INSERT INTO commits (commit_id, proposal_id, token_id, decision, verification_reason, created_at)
-                VALUES ($1, $2, $3, $4, $5, $6)
-                """,
+                SAVE_COMMIT_SQL,
                 kwargs["commit_id"],
                 kwargs["proposal_id"],
                 kwargs["token_id"],
@@ -179,22 +367,22 @@ class PostgresStorage(ProposalCommitStorage):
                 kwargs["created_at"],
             )
 
-    async def nonce_seen(self, nonce: str, token_id: str, expires_at: datetime) -> bool:
-        await self.connect()
-        assert self.pool is not None
-        async with self.pool.acquire() as conn:
-            async with conn.transaction():
-                await conn.execute("DELETE FROM nonces WHERE expires_at <= NOW()")
-                exists = await conn.fetchrow("SELECT nonce FROM nonces WHERE nonce=$1", nonce)
-                if exists:
-                    return True
-                await conn.execute(
-                    "INSERT INTO nonces (nonce, token_id, expires_at) VALUES ($1, $2, $3)",
-                    nonce,
-                    token_id,
-                    expires_at,
-                )
-                return False
+    async def nonce_seen(self, nonce: str, token_id: str, expires_at_epoch: int) -> bool:
+        async with self._connection() as conn:
+            claimed = await conn.fetchval(NONCE_CLAIM_SQL, nonce, token_id, expires_at_epoch)
+            return claimed is None
+
+
+def _proposal_row(p: dict[str, Any]) -> tuple[Any, ...]:
+    return (
+        p["proposal_id"],
+        p["tool_name"],
+        p["args_json"],
+        p["prompt_hash"],
+        p["composite_score"],
+        p["decision"],
+        p["created_at"],
+    )
 
 
 def create_storage_from_env() -> ProposalCommitStorage:
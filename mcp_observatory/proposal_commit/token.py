@@ -7,10 +7,9 @@ import hmac
 import json
 import os
 from dataclasses import dataclass
-from hashlib import sha256
 from time import time
 from typing import Any
-from uuid import uuid4
+from uuid import UUID
 
 
 @dataclass(frozen=True)
@@ -33,6 +32,14 @@ class CommitTokenManager:
     def __init__(self, secret: str | None = None, ttl_seconds: int = 60) -> None:
         self.secret = (secret or os.getenv("MCP_OBSERVATORY_COMMIT_SECRET", "dev-commit-secret")).encode("utf-8")
         self.ttl_seconds = ttl_seconds
+        # Keyed once; each signature clones this state instead of re-deriving
+        # the ipad/opad blocks from the secret.
+        self._hmac_template = hmac.new(self.secret, digestmod="sha256")
+
+    def _sign(self, payload_raw: bytes) -> bytes:
+        h = self._hmac_template.copy()
+        h.update(payload_raw)
+        return h.digest()
 
     def issue(
         self,
@@ -43,35 +50,40 @@ class CommitTokenManager:
         composite_score: float,
     ) -> TokenIssueResult:
         issued_at = int(time())
+        # One urandom read for both random v4 UUIDs (token_id and nonce).
+        raw = os.urandom(32)
         token_payload = {
-            "token_id": str(uuid4()),
+            "token_id": str(UUID(bytes=raw[:16], version=4)),
             "proposal_id": proposal_id,
             "tool_name": tool_name,
             "tool_args_hash": tool_args_hash,
             "issued_at": issued_at,
             "expires_at": issued_at + self.ttl_seconds,
-            "nonce": str(uuid4()),
+            "nonce": str(UUID(bytes=raw[16:], version=4)),
             "composite_score": composite_score,
         }
         payload_raw = json.dumps(token_payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
-        sig = hmac.new(self.secret, payload_raw, sha256).digest()
+        sig = self._sign(payload_raw)
         token = f"{base64.urlsafe_b64encode(payload_raw).decode()}.{base64.urlsafe_b64encode(sig).decode()}"
         return TokenIssueResult(token=token, token_id=token_payload["token_id"], payload=token_payload)
 
     def verify(self, token: str) -> TokenVerifyResult:
+        dot = token.find(".")
+        if dot < 0:
+            return TokenVerifyResult(valid=False, reason="bad_signature")
         try:
-            payload_b64, sig_b64 = token.split(".", 1)
-            payload_raw = base64.urlsafe_b64decode(payload_b64.encode("utf-8"))
-            sig = base64.urlsafe_b64decode(sig_b64.encode("utf-8"))
+            payload_raw = base64.urlsafe_b64decode(token[:dot])
+            sig = base64.urlsafe_b64decode(token[dot + 1 :])
         except Exception:
             return TokenVerifyResult(valid=False, reason="bad_signature")
 
-        expected = hmac.new(self.secret, payload_raw, sha256).digest()
+        # Check the signature before parsing so forged tokens never reach json.
+        expected = self._sign(payload_raw)
         if not hmac.compare_digest(expected, sig):
             return TokenVerifyResult(valid=False, reason="bad_signature")
 
         try:
-            payload = json.loads(payload_raw.decode("utf-8"))
+            payload = json.loads(payload_raw)
         except Exception:
             return TokenVerifyResult(valid=False, reason="bad_signature")
 
@@ -1,6 +1,6 @@
 """Risk vector computation APIs."""
 
-from .scoring import clamp01, composite_risk_score
-from .vector import RiskVector, compute_risk_vector
+from .scoring import clamp01, composite_risk_score, composite_risk_score_values
+from .vector import RiskVector, compute_risk_vector, compute_risk_vector_async
 
-__all__ = ["clamp01", "composite_risk_score", "RiskVector", "compute_risk_vector"]
+__all__ = ["clamp01", "composite_risk_score", "composite_risk_score_values", "RiskVector", "compute_risk_vector", "compute_risk_vector_async"]
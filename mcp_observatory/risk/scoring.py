@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from typing import Dict, Optional, Tuple
+from functools import reduce
+from operator import add
+from typing import Dict, Optional, Sequence, Tuple
 
 
 DEFAULT_WEIGHTS: Dict[str, float] = {
@@ -14,6 +16,11 @@ DEFAULT_WEIGHTS: Dict[str, float] = {
     "drift_risk": 0.10,
 }
 
+_DEFAULT_ITEMS: Tuple[Tuple[str, float], ...] = tuple(DEFAULT_WEIGHTS.items())
+# Summed left to right, exactly as the general loop accumulates its weights.
+_DEFAULT_TOTAL: float = reduce(add, DEFAULT_WEIGHTS.values(), 0.0)
+_DEFAULT_WEIGHT_VALUES: Tuple[float, ...] = tuple(DEFAULT_WEIGHTS.values())
+
 
 def clamp01(x: float) -> float:
     return max(0.0, min(1.0, x))
@@ -29,6 +36,19 @@ def risk_level(score: float) -> str:
 
 def composite_risk_score(components: Dict[str, Optional[float]], weights: Optional[Dict[str, float]] = None) -> Tuple[float, str]:
     """Compute weighted composite risk with renormalized weights for non-null components."""
+    if not weights:
+        # Common case: default weights with every component present, so the
+        # total weight is the precomputed constant.
+        weighted_sum = 0.0
+        for name, weight in _DEFAULT_ITEMS:
+            value = components.get(name)
+            if value is None:
+                break
+            weighted_sum += clamp01(value) * weight
+        else:
+            score = clamp01(weighted_sum / _DEFAULT_TOTAL)
+            return score, risk_level(score)
+
     active_weights = weights or DEFAULT_WEIGHTS
     weighted_sum = 0.0
     total_weight = 0.0
@@ -43,3 +63,19 @@ def composite_risk_score(components: Dict[str, Optional[float]], weights: Option
         return 0.0, "low"
     score = clamp01(weighted_sum / total_weight)
     return score, risk_level(score)
+
+
+def composite_risk_score_values(values: Sequence[Optional[float]]) -> Tuple[float, str]:
+    """Default-weight :func:`composite_risk_score` over values ordered like ``DEFAULT_WEIGHTS``."""
+    weighted_sum = 0.0
+    total_weight = 0.0
+    for value, weight in zip(values, _DEFAULT_WEIGHT_VALUES, strict=True):
+        if value is None:
+            continue
+        weighted_sum += clamp01(value) * weight
+        total_weight += weight
+
+    if total_weight <= 0:
+        return 0.0, "low"
+    score = clamp01(weighted_sum / total_weight)
+    return score, risk_level(score)
@@ -3,107 +3,134 @@
 from __future__ import annotations
 
 import re
-from statistics import mean
+from functools import lru_cache
 from typing import Optional, Sequence
 
 from ..utils.hashing import normalize_text, sha256_hex
+from ..utils.text import word_tokens
 
-_WORD_RE = re.compile(r"\b\w+\b")
 _NUM_RE = re.compile(r"[-+]?\d*\.?\d+")
 
+# Substring matchers (no word boundaries) for the tool-mismatch markers.
+_FAILURE_RE = re.compile(r"fail|error|declined|denied|timeout")
+_SUCCESS_RE = re.compile(r"success|completed|done|sent|processed")
+# Hedging and overconfident phrasing for the verifier heuristic.
+_HEDGE_RE = re.compile(r"maybe|not sure|possibly|might")
+_CERTAINTY_RE = re.compile(r"always|definitely|guaranteed|never")
+
 
 def _tokenize(value: Optional[str]) -> set[str]:
     if not value:
         return set()
-    return set(_WORD_RE.findall(normalize_text(value)))
+    return word_tokens(value)
+
 
+@lru_cache(maxsize=256)
+def _context_tokens(retrieved_context: str) -> frozenset[str]:
+    # Retrieved context is usually shared across many calls; tokenize it once.
+    return frozenset(word_tokens(retrieved_context))
 
-def _jaccard(a: set[str], b: set[str]) -> float:
+
+def jaccard_distance(a: frozenset[str] | set[str], b: frozenset[str] | set[str]) -> float:
     if not a and not b:
-        return 1.0
-    union = a | b
-    if not union:
-        return 1.0
-    return len(a & b) / len(union)
+        return 0.0
+    # |A ∪ B| = |A| + |B| - |A ∩ B|: only the (smaller) intersection set is built.
+    inter = len(a & b)
+    return 1.0 - inter / (len(a) + len(b) - inter)
 
 
 def clamp01(x: float) -> float:
     return max(0.0, min(1.0, x))
 
 
-def prompt_hash(prompt: str) -> str:
+@lru_cache(maxsize=4096)
+def _prompt_hash_cached(prompt: str) -> str:
     return sha256_hex(normalize_text(prompt))
 
 
+def prompt_hash(prompt: str) -> str:
+    # Keyed by the raw prompt, so a repeat skips normalization and hashing.
+    return _prompt_hash_cached(prompt)
+
+
 def drift_risk(*, previous_prompt_hash: Optional[str], current_prompt_hash: str) -> float:
     if not previous_prompt_hash:
         return 0.0
     return 1.0 if previous_prompt_hash != current_prompt_hash else 0.0
 
 
+def grounding_risk_from_tokens(answer_tokens: set[str], retrieved_context: Optional[str]) -> Optional[float]:
+    if not retrieved_context:
+        return None
+    return jaccard_distance(answer_tokens, _context_tokens(retrieved_context))
+
+
 def grounding_risk(answer: str, retrieved_context: Optional[str]) -> Optional[float]:
     if not retrieved_context:
         return None
-    score = _jaccard(_tokenize(answer), _tokenize(retrieved_context))
-    return clamp01(1.0 - score)
+    return grounding_risk_from_tokens(_tokenize(answer), retrieved_context)
 
 
 def self_consistency_risk(answer: str, secondary_answer: Optional[str]) -> Optional[float]:
     if not secondary_answer:
         return None
-    score = _jaccard(_tokenize(answer), _tokenize(secondary_answer))
-    return clamp01(1.0 - score)
+    if secondary_answer == answer:
+        return 0.0
+    return jaccard_distance(_tokenize(answer), word_tokens(secondary_answer))
 
 
-def _extract_numbers(text: Optional[str]) -> list[float]:
+def extract_numbers(text: Optional[str]) -> list[float]:
     if not text:
         return []
-    out: list[float] = []
-    for token in _NUM_RE.findall(text):
-        try:
-            out.append(float(token))
-        except ValueError:
-            continue
-    return out
+    # Every _NUM_RE match is a valid float literal.
+    return list(map(float, _NUM_RE.findall(text)))
 
 
-def numeric_instability_risk(answer: str, secondary_answer: Optional[str]) -> Optional[float]:
-    primary = _extract_numbers(answer)
+def numeric_instability_risk_from_numbers(primary: list[float], secondary: Optional[list[float]]) -> Optional[float]:
+    # ``secondary`` is None when there is no secondary answer to compare against.
     if not primary:
         return None
-    if secondary_answer:
-        secondary = _extract_numbers(secondary_answer)
-        n = min(len(primary), len(secondary))
-        if n == 0:
+    if secondary is not None:
+        if not secondary:
             return 1.0
-        diffs = [abs(primary[i] - secondary[i]) / max(1e-9, abs(primary[i])) for i in range(n)]
-        return clamp01(mean(diffs))
+        # zip() stops at the shorter list, matching the pairwise comparison.
+        diffs = [abs(x - y) / max(1e-9, abs(x)) for x, y in zip(primary, secondary)]
+        return clamp01(sum(diffs) / len(diffs))
 
     if len(primary) < 2:
         return 0.0
-    spread = (max(primary) - min(primary)) / max(1e-9, abs(mean(primary)))
+    spread = (max(primary) - min(primary)) / max(1e-9, abs(sum(primary) / len(primary)))
     return clamp01(spread)
 
 
+def numeric_instability_risk(answer: str, secondary_answer: Optional[str]) -> Optional[float]:
+    secondary = extract_numbers(secondary_answer) if secondary_answer else None
+    return numeric_instability_risk_from_numbers(extract_numbers(answer), secondary)
+
+
+def tool_mismatch_risk_from_normalized(answer_norm: str, tool_result_summary: Optional[str]) -> float:
+    if not tool_result_summary:
+        return 0.0
+    tool_failed = _FAILURE_RE.search(normalize_text(tool_result_summary)) is not None
+    return 1.0 if (tool_failed and _SUCCESS_RE.search(answer_norm) is not None) else 0.0
+
+
 def tool_mismatch_risk(answer: str, tool_result_summary: Optional[str]) -> float:
     if not tool_result_summary:
         return 0.0
-    answer_n = normalize_text(answer)
-    tool_n = normalize_text(tool_result_summary)
-    failure_markers = ("fail", "error", "declined", "denied", "timeout")
-    success_markers = ("success", "completed", "done", "sent", "processed")
-    tool_failed = any(m in tool_n for m in failure_markers)
-    answer_claims_success = any(m in answer_n for m in success_markers)
-    return 1.0 if (tool_failed and answer_claims_success) else 0.0
+    return tool_mismatch_risk_from_normalized(normalize_text(answer), tool_result_summary)
 
 
-def verifier_risk(answer: str, *, low_grounding: bool = False) -> float:
-    text = normalize_text(answer)
+def verifier_risk_from_normalized(answer_norm: str, *, low_grounding: bool = False) -> float:
     score = 1.0
-    if any(t in text for t in ("maybe", "not sure", "possibly", "might")):
+    if _HEDGE_RE.search(answer_norm):
         score -= 0.2
-    if any(t in text for t in ("always", "definitely", "guaranteed", "never")):
+    if _CERTAINTY_RE.search(answer_norm):
         score -= 0.15
     if low_grounding:
         score -= 0.25
     return clamp01(1.0 - clamp01(score))
+
+
+def verifier_risk(answer: str, *, low_grounding: bool = False) -> float:
+    return verifier_risk_from_normalized(normalize_text(answer), low_grounding=low_grounding)
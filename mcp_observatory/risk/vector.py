@@ -2,18 +2,22 @@
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 from typing import Optional
 
-from .scoring import composite_risk_score
+from ..utils.hashing import normalize_text
+from ..utils.text import word_tokens
+from .scoring import composite_risk_score_values
 from .signals import (
     drift_risk,
-    grounding_risk,
-    numeric_instability_risk,
+    extract_numbers,
+    grounding_risk_from_tokens,
+    jaccard_distance,
+    numeric_instability_risk_from_numbers,
     prompt_hash,
-    self_consistency_risk,
-    tool_mismatch_risk,
-    verifier_risk,
+    tool_mismatch_risk_from_normalized,
+    verifier_risk_from_normalized,
 )
 
 
@@ -42,23 +46,30 @@ def compute_risk_vector(
     previous_prompt_hash: Optional[str] = None,
 ) -> RiskVector:
     p_hash = prompt_hash(prompt)
-    g_risk = grounding_risk(answer, retrieved_context)
-    sc_risk = self_consistency_risk(answer, secondary_answer)
-    ni_risk = numeric_instability_risk(answer, secondary_answer)
-    tm_risk = tool_mismatch_risk(answer, tool_result_summary)
+    # Normalize, tokenize and scan the answer once; every signal reuses these.
+    answer_norm = normalize_text(answer)
+    # An identical secondary answer cannot disagree; skip its tokenization.
+    same_secondary = bool(secondary_answer) and secondary_answer == answer
+    needs_tokens = bool(retrieved_context) or (bool(secondary_answer) and not same_secondary)
+    answer_tokens = word_tokens(answer_norm) if needs_tokens else set()
+    answer_numbers = extract_numbers(answer)
+
+    if not secondary_answer:
+        sc_risk, secondary_numbers = None, None
+    elif same_secondary:
+        sc_risk, secondary_numbers = 0.0, answer_numbers
+    else:
+        secondary_numbers = extract_numbers(secondary_answer)
+        sc_risk = jaccard_distance(answer_tokens, word_tokens(secondary_answer))
+
+    g_risk = grounding_risk_from_tokens(answer_tokens, retrieved_context)
+    ni_risk = numeric_instability_risk_from_numbers(answer_numbers, secondary_numbers)
+    tm_risk = tool_mismatch_risk_from_normalized(answer_norm, tool_result_summary)
     d_risk = drift_risk(previous_prompt_hash=previous_prompt_hash, current_prompt_hash=p_hash)
-    v_risk = verifier_risk(answer, low_grounding=(g_risk is not None and g_risk > 0.75))
+    v_risk = verifier_risk_from_normalized(answer_norm, low_grounding=(g_risk is not None and g_risk > 0.75))
 
-    score, level = composite_risk_score(
-        {
-            "grounding_risk": g_risk,
-            "self_consistency_risk": sc_risk,
-            "verifier_risk": v_risk,
-            "numeric_instability_risk": ni_risk,
-            "tool_mismatch_risk": tm_risk,
-            "drift_risk": d_risk,
-        }
-    )
+    # Ordered like DEFAULT_WEIGHTS.
+    score, level = composite_risk_score_values((g_risk, sc_risk, v_risk, ni_risk, tm_risk, d_risk))
 
     return RiskVector(
         prompt_hash=p_hash,
@@ -71,3 +82,28 @@ def compute_risk_vector(
         composite_risk_score=score,
         composite_risk_level=level,
     )
+
+
+async def compute_risk_vector_async(
+    *,
+    prompt: str,
+    answer: str,
+    retrieved_context: Optional[str] = None,
+    secondary_answer: Optional[str] = None,
+    tool_result_summary: Optional[str] = None,
+    previous_prompt_hash: Optional[str] = None,
+) -> RiskVector:
+    """Run :func:`compute_risk_vector` in a worker thread.
+
+    Useful for long answers or contexts that would otherwise stall the event
+    loop; for short inputs the thread hop costs more than the computation.
+    """
+    return await asyncio.to_thread(
+        compute_risk_vector,
+        prompt=prompt,
+        answer=answer,
+        retrieved_context=retrieved_context,
+        secondary_answer=secondary_answer,
+        tool_result_summary=tool_result_summary,
+        previous_prompt_hash=previous_prompt_hash,
+    )
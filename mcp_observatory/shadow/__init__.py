@@ -1,6 +1,6 @@
 """Shadow evaluation lane utilities."""
 
-from .compare import disagreement_score, numeric_variance
+from .compare import compare, disagreement_score, numeric_variance
 from .lane import run_shadow_lane, schedule_shadow_lane
 
-__all__ = ["disagreement_score", "numeric_variance", "run_shadow_lane", "schedule_shadow_lane"]
+__all__ = ["compare", "disagreement_score", "numeric_variance", "run_shadow_lane", "schedule_shadow_lane"]
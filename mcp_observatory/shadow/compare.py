@@ -3,30 +3,57 @@
 from __future__ import annotations
 
 import re
-from statistics import mean
 
-_WORD_RE = re.compile(r"\b\w+\b")
+from ..utils.text import word_tokens
+
 _NUM_RE = re.compile(r"[-+]?\d*\.?\d+")
 
 
-def _tokens(text: str) -> set[str]:
-    return set(_WORD_RE.findall(text.lower()))
+def _numbers(text: str) -> list[float]:
+    return [float(v) for v in _NUM_RE.findall(text)]
 
 
-def disagreement_score(primary: str, shadow: str) -> float:
-    a, b = _tokens(primary), _tokens(shadow)
+def _disagreement(a: set[str], b: set[str]) -> float:
     if not a and not b:
         return 0.0
-    union = a | b
-    similarity = len(a & b) / len(union) if union else 1.0
-    return 1.0 - similarity
+    # |A ∪ B| = |A| + |B| - |A ∩ B|: only the (smaller) intersection set is built.
+    inter = len(a & b)
+    return 1.0 - inter / (len(a) + len(b) - inter)
+
+
+def _diff_mean(a: list[float], b: list[float]) -> float:
+    # Mean relative difference over the pairs zip() yields (the shorter length).
+    total = 0.0
+    n = 0
+    for x, y in zip(a, b):
+        total += abs(x - y) / max(1e-9, abs(x))
+        n += 1
+    return total / n if n else 0.0
+
+
+def _variance(a: list[float], b: list[float]) -> float:
+    if not a or not b:
+        return 0.0
+    return max(0.0, min(1.0, _diff_mean(a, b)))
+
+
+def disagreement_score(primary: str, shadow: str) -> float:
+    if primary == shadow:
+        return 0.0
+    return _disagreement(word_tokens(primary), word_tokens(shadow))
 
 
 def numeric_variance(primary: str, shadow: str) -> float:
-    a = [float(v) for v in _NUM_RE.findall(primary)]
-    b = [float(v) for v in _NUM_RE.findall(shadow)]
-    n = min(len(a), len(b))
-    if n == 0:
+    if primary == shadow:
         return 0.0
-    diffs = [abs(a[i] - b[i]) / max(1e-9, abs(a[i])) for i in range(n)]
-    return max(0.0, min(1.0, mean(diffs)))
+    return _variance(_numbers(primary), _numbers(shadow))
+
+
+def compare(primary: str, shadow: str) -> tuple[float, float]:
+    """Return ``(disagreement_score, numeric_variance)`` in one call."""
+    if primary == shadow:
+        return 0.0, 0.0
+    return (
+        _disagreement(word_tokens(primary), word_tokens(shadow)),
+        _variance(_numbers(primary), _numbers(shadow)),
+    )
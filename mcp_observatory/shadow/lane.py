@@ -7,7 +7,7 @@ from typing import Awaitable, Callable, Optional
 
 from ..core.context import TraceContext
 from ..exporters.base import Exporter
-from .compare import disagreement_score, numeric_variance
+from .compare import compare
 
 ShadowCallable = Callable[[str], Awaitable[str]]
 
@@ -30,8 +30,7 @@ async def run_shadow_lane(
         shadow_parent_trace_id=parent_context.trace_id,
     )
     answer = shadow_answer or ""
-    span.shadow_disagreement_score = disagreement_score(primary_answer, answer)
-    span.shadow_numeric_variance = numeric_variance(primary_answer, answer)
+    span.shadow_disagreement_score, span.shadow_numeric_variance = compare(primary_answer, answer)
     span.finish()
     if exporter is not None:
         await exporter.export(span)
@@ -5,14 +5,40 @@ from __future__ import annotations
 import base64
 import hmac
 import json
+import math
 import os
 from hashlib import sha256
-from uuid import uuid4
+from json.encoder import encode_basestring_ascii as _json_str
 
 from ..utils.time import utc_now
 from .types import IssuedToken
 
 
+def _json_number(value: float) -> str:
+    if isinstance(value, (int, float)) and not isinstance(value, bool) and math.isfinite(value):
+        return repr(value)
+    return json.dumps(value)
+
+
+def _serialize_payload(payload: dict) -> bytes:
+    """Encode the known token schema exactly as ``json.dumps(sort_keys=True)`` would.
+
+    Keys are written in sorted order by hand, so no per-call key sort or
+    generic encoder dispatch is needed.
+    """
+    return (
+        f'{{"composite_risk_score":{_json_number(payload["composite_risk_score"])},'
+        f'"decision":{_json_str(payload["decision"])},'
+        f'"expires_at":{payload["expires_at"]:d},'
+        f'"issued_at":{payload["issued_at"]:d},'
+        f'"nonce":{_json_str(payload["nonce"])},'
+        f'"token_id":{_json_str(payload["token_id"])},'
+        f'"tool_args_hash":{_json_str(payload["tool_args_hash"])},'
+        f'"tool_name":{_json_str(payload["tool_name"])},'
+        f'"trace_id":{_json_str(payload["trace_id"])}}}'
+    ).encode("ascii")
+
+
 class TokenIssuer:
     """Issue compact signed tokens for internal tool execution authorization."""
 
@@ -30,8 +56,10 @@ class TokenIssuer:
         composite_risk_score: float,
     ) -> IssuedToken:
         issued_at = int(utc_now().timestamp() * 1000)
+        # One urandom read yields both opaque 128-bit hex ids (token_id, nonce).
+        ids = os.urandom(32).hex()
         payload = {
-            "token_id": str(uuid4()),
+            "token_id": ids[:32],
             "trace_id": trace_id,
             "tool_name": tool_name,
             "tool_args_hash": tool_args_hash,
@@ -39,10 +67,13 @@ class TokenIssuer:
             "composite_risk_score": composite_risk_score,
             "issued_at": issued_at,
             "expires_at": issued_at + self.ttl_ms,
-            "nonce": str(uuid4()),
+            "nonce": ids[32:],
         }
-        payload_raw = json.dumps(payload, separators=(",", ":"), sort_keys=True).encode("utf-8")
+        payload_raw = _serialize_payload(payload)
         sig = hmac.new(self._secret, payload_raw, sha256).digest()
         token = f"{base64.urlsafe_b64encode(payload_raw).decode('utf-8')}.{base64.urlsafe_b64encode(sig).decode('utf-8')}"
-        token_hash = sha256(token.encode("utf-8")).hexdigest()
+        # The signature already binds the whole payload; hashing its 32 bytes
+        # fingerprints the token without a second pass over the token text,
+        # and keeps the raw signature out of exported spans.
+        token_hash = sha256(sig).hexdigest()
         return IssuedToken(token=token, token_id=payload["token_id"], token_hash=token_hash, ttl_ms=self.ttl_ms, payload=payload)
@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 import base64
+import heapq
 import hmac
 import json
 import os
 from hashlib import sha256
-from typing import Dict
+from typing import Dict, List, Tuple
 
 from ..utils.time import utc_now
 from .types import VerificationResult
@@ -19,7 +20,11 @@ class TokenVerifier:
     def __init__(self, *, secret_key: str | None = None, replay_protection: bool = True) -> None:
         self._secret = (secret_key or os.getenv("MCP_OBSERVATORY_TOKEN_SECRET", "dev-secret")).encode("utf-8")
         self._seen: Dict[str, int] = {}
+        self._exp_heap: List[Tuple[int, str]] = []
         self._replay_protection = replay_protection
+        # Keyed once; each verification clones this state instead of
+        # re-deriving the ipad/opad blocks from the secret.
+        self._hmac_template = hmac.new(self._secret, digestmod=sha256)
 
     def verify(self, token: str, *, tool_name: str, tool_args_hash: str) -> VerificationResult:
         try:
@@ -29,7 +34,9 @@ class TokenVerifier:
         except Exception:
             return VerificationResult(False, "token_decode_failed")
 
-        expected_sig = hmac.new(self._secret, payload_raw, sha256).digest()
+        h = self._hmac_template.copy()
+        h.update(payload_raw)
+        expected_sig = h.digest()
         if not hmac.compare_digest(sig, expected_sig):
             return VerificationResult(False, "invalid_signature")
 
@@ -55,10 +62,14 @@ class TokenVerifier:
             if token_id in self._seen:
                 return VerificationResult(False, "token_replay_detected", payload=payload)
             self._seen[token_id] = exp
+            heapq.heappush(self._exp_heap, (exp, token_id))
 
         return VerificationResult(True, "ok", payload=payload)
 
     def _gc(self, now_ms: int) -> None:
-        expired = [k for k, v in self._seen.items() if v <= now_ms]
-        for k in expired:
-            self._seen.pop(k, None)
+        heap = self._exp_heap
+        while heap and heap[0][0] <= now_ms:
+            exp, token_id = heapq.heappop(heap)
+            # Skip stale heap entries for ids re-stored with a later expiry.
+            if self._seen.get(token_id) == exp:
+                del self._seen[token_id]
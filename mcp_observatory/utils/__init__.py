@@ -1,6 +1,7 @@
 """Utility helpers for hashing and time operations."""
 
 from .hashing import args_hash, normalize_text, sha256_hex
+from .text import word_tokens
 from .time import utc_now, utc_now_naive
 
-__all__ = ["sha256_hex", "normalize_text", "args_hash", "utc_now", "utc_now_naive"]
+__all__ = ["sha256_hex", "normalize_text", "args_hash", "word_tokens", "utc_now", "utc_now_naive"]
@@ -4,11 +4,10 @@ from __future__ import annotations
 
 import hashlib
 import json
-import re
+from collections.abc import Mapping
+from functools import lru_cache
 from typing import Any
 
-_WS_RE = re.compile(r"\s+")
-
 
 def sha256_hex(value: str) -> str:
     """Return SHA-256 hex digest for the provided string value."""
@@ -17,10 +16,24 @@ def sha256_hex(value: str) -> str:
 
 def normalize_text(value: str) -> str:
     """Normalize text for stable hashing and set comparisons."""
-    return _WS_RE.sub(" ", value.strip().lower())
+    return " ".join(value.lower().split())
 
 
 def args_hash(tool_args: Any) -> str:
     """Return stable SHA-256 hash for JSON-serializable arguments."""
-    payload = json.dumps(tool_args, sort_keys=True, separators=(",", ":"), default=str)
-    return sha256_hex(normalize_text(payload))
+    payload = json.dumps(tool_args, sort_keys=True, separators=(",", ":"), default=_json_default)
+    return _payload_hash(payload)
+
+
+def _json_default(value: Any) -> Any:
+    # Read-only mappings (e.g. MappingProxyType) hash like the dicts they wrap.
+    if isinstance(value, Mapping):
+        return dict(value)
+    return str(value)
+
+
+@lru_cache(maxsize=4096)
+def _payload_hash(payload: str) -> str:
+    # Keyed by the serialized arguments: dicts are unhashable, their JSON is not.
+    # json.dumps escapes to ASCII by default, so the cheap ascii codec applies.
+    return hashlib.sha256(payload.encode("ascii")).hexdigest()
@@ -0,0 +1,24 @@
+"""Text tokenization helpers shared by the scoring modules."""
+
+from __future__ import annotations
+
+import re
+
+_WORD_RE = re.compile(r"\b\w+\b")
+
+# ASCII fast path for word_tokens: lowercase A-Z and blank out every non-word
+# character so str.split() yields exactly the ``\w+`` runs.
+_ASCII_TOKEN_TABLE = str.maketrans(
+    {
+        code: code + 32 if 65 <= code <= 90 else 32
+        for code in range(128)
+        if not (chr(code).isalnum() or chr(code) == "_") or 65 <= code <= 90
+    }
+)
+
+
+def word_tokens(text: str) -> set[str]:
+    """Return the set of lowercased ``\\w+`` tokens in text."""
+    if text.isascii():
+        return set(text.translate(_ASCII_TOKEN_TABLE).split())
+    return set(_WORD_RE.findall(text.lower()))
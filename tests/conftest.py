@@ -0,0 +1,110 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Optional
+
+import asyncpg
+import pytest
+
+try:
+    import uvloop
+except ImportError:  # uvloop is optional; fall back to the stdlib loop.
+    uvloop = None
+
+_LOOP_FACTORY: Optional[Callable[[], asyncio.AbstractEventLoop]] = uvloop.new_event_loop if uvloop else None
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    # Pay the package's import cost once, at configure time, instead of inside
+    # whichever test happens to touch it first.
+    import mcp_observatory.fallback.router  # noqa: F401
+    import mcp_observatory.instrument  # noqa: F401
+    import mcp_observatory.policy.registry  # noqa: F401
+
+
+@pytest.fixture(scope="session")
+def event_loop_runner() -> Iterator[asyncio.Runner]:
+    """One event loop for the whole session instead of a fresh one per ``asyncio.run``."""
+    with asyncio.Runner(loop_factory=_LOOP_FACTORY) as runner:
+        yield runner
+
+
+class FakeConnection:
+    """Records the writes an asyncpg connection would send to Postgres."""
+
+    def __init__(self, pool: "FakePool") -> None:
+        self.pool = pool
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[None]:
+        yield
+
+    async def execute(self, sql: str, *args: Any) -> None:
+        await self.pool.write(sql, [args])
+
+    async def executemany(self, sql: str, rows: list[tuple[Any, ...]]) -> None:
+        await self.pool.write(sql, rows)
+
+    async def copy_records_to_table(self, table: str, *, records: list[tuple[Any, ...]], columns: tuple[str, ...]) -> None:
+        await self.pool.write(table, records)
+
+
+class FakePool:
+    """Stands in for an ``asyncpg.Pool``.
+
+    The next ``failures`` writes raise a connection error; a write touching a
+    row whose first column is in ``rejected`` raises a unique violation and,
+    like a real batch, writes nothing. While ``gate`` is set to an unset event,
+    writes wait on it; ``waiting`` counts the writes currently held there.
+    """
+
+    def __init__(self) -> None:
+        self.failures = 0
+        self.rejected: frozenset[Any] = frozenset()
+        self.gate: Optional[asyncio.Event] = None
+        self.waiting = 0
+        self.writes: list[tuple[str, tuple[Any, ...]]] = []
+
+    async def write(self, target: str, rows: list[tuple[Any, ...]]) -> None:
+        if self.gate is not None:
+            self.waiting += 1
+            try:
+                await self.gate.wait()
+            finally:
+                self.waiting -= 1
+        if self.failures:
+            self.failures -= 1
+            raise asyncpg.PostgresConnectionError("connection reset")
+        if any(row[0] in self.rejected for row in rows):
+            raise asyncpg.UniqueViolationError("duplicate key value violates unique constraint")
+        self.writes.extend((target, row) for row in rows)
+
+    def rows(self, target: str) -> list[tuple[Any, ...]]:
+        """Rows written by ``target`` (a SQL statement or a COPY table name), in order."""
+        return [row for written, row in self.writes if written == target]
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[FakeConnection]:
+        yield FakeConnection(self)
+
+    async def close(self) -> None:
+        pass
+
+
+@pytest.fixture
+def fake_pool() -> FakePool:
+    return FakePool()
+
+
+async def _wait_for(predicate: Callable[[], bool], timeout: float = 1.0) -> None:
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not predicate():
+        assert loop.time() < deadline, "condition not met before timeout"
+        await asyncio.sleep(0.001)
+
+
+@pytest.fixture
+def wait_for() -> Callable[..., Awaitable[None]]:
+    """Poll a predicate on the running loop until it holds (or fail after ``timeout``)."""
+    return _wait_for
@@ -0,0 +1,54 @@
+import asyncio
+from typing import Optional
+
+from mcp_observatory import instrument
+from mcp_observatory.hallucination import NormalizedInputs, Verifier
+
+
+class PlainVerifier:
+    """Matches the Verifier protocol structurally, without subclassing it."""
+
+    async def score(self, prompt: str, answer: str, context: Optional[str] = None) -> tuple[float, str]:
+        return 0.4, "plain"
+
+
+class SubclassVerifier(Verifier):
+    async def score(self, prompt: str, answer: str, context: Optional[str] = None) -> tuple[float, str]:
+        return 0.6, "subclass"
+
+
+class NormalizedVerifier(Verifier):
+    seen: Optional[NormalizedInputs] = None
+
+    async def score(self, prompt: str, answer: str, context: Optional[str] = None) -> tuple[float, str]:
+        raise AssertionError("score_normalized should be preferred")
+
+    async def score_normalized(
+        self, prompt: str, answer: str, context: Optional[str] = None, *, normalized: NormalizedInputs
+    ) -> tuple[float, str]:
+        self.seen = normalized
+        return 0.8, "normalized"
+
+
+def _verifier_score(verifier: object) -> Optional[float]:
+    interceptor = instrument("unit-test-verifier", verifier=verifier)
+    _result, span = asyncio.run(
+        interceptor.intercept_model_call(
+            model="gpt-4o",
+            prompt="Hello",
+            response="World Peace",
+            retrieved_context="world",
+            return_span=True,
+        )
+    )
+    return span.verifier_score
+
+
+def test_custom_verifiers_are_scored_through_the_protocol() -> None:
+    normalized = NormalizedVerifier()
+
+    assert _verifier_score(PlainVerifier()) == 0.4
+    assert _verifier_score(SubclassVerifier()) == 0.6
+    assert _verifier_score(normalized) == 0.8
+    assert normalized.seen is not None
+    assert normalized.seen.answer_norm == "world peace"
@@ -0,0 +1,59 @@
+import asyncio
+
+from mcp_observatory.core.context import TraceContext
+from mcp_observatory.exporters.postgres import INSERT_SQL, PostgresExporter
+
+
+def _span_ids(pool) -> list[str]:
+    # Single spans go through INSERT_SQL, batches through COPY into mcp_traces.
+    return [str(row[1]) for target, row in pool.writes if target in (INSERT_SQL, "mcp_traces")]
+
+
+def test_flush_loop_survives_transient_errors(event_loop_runner: asyncio.Runner, fake_pool, wait_for) -> None:
+    async def scenario() -> None:
+        fake_pool.failures = 2
+        exporter = PostgresExporter(pool=fake_pool, max_interval=0.001, retry_backoff=0.001)
+        spans = [TraceContext(service="svc") for _ in range(3)]
+        await exporter.export(spans[0])
+        await exporter.export(spans[1])
+        await wait_for(lambda: len(_span_ids(fake_pool)) == 2)
+
+        # The loop is still running: a later span is written without close().
+        await exporter.export(spans[2])
+        await wait_for(lambda: len(_span_ids(fake_pool)) == 3)
+        assert sorted(_span_ids(fake_pool)) == sorted(span.span_id for span in spans)
+        await exporter.close()
+
+    event_loop_runner.run(scenario())
+
+
+def test_export_restarts_a_dead_flush_task(event_loop_runner: asyncio.Runner, fake_pool, wait_for) -> None:
+    async def scenario() -> None:
+        exporter = PostgresExporter(pool=fake_pool, max_interval=0.001)
+        await exporter.connect()
+        exporter._flush_task.cancel()
+        await asyncio.sleep(0)
+
+        span = TraceContext(service="svc")
+        await exporter.export(span)
+
+        await wait_for(lambda: _span_ids(fake_pool) == [span.span_id])
+        await exporter.close()
+
+    event_loop_runner.run(scenario())
+
+
+def test_buffer_is_capped_while_writes_fail(event_loop_runner: asyncio.Runner, fake_pool) -> None:
+    async def scenario() -> None:
+        fake_pool.failures = 1_000
+        exporter = PostgresExporter(pool=fake_pool, max_interval=60.0, max_buffer=3)
+        spans = [TraceContext(service="svc") for _ in range(5)]
+        for span in spans:
+            await exporter.export(span)
+
+        fake_pool.failures = 0
+        await exporter.close()
+        # Only the newest ``max_buffer`` spans survive, in export order.
+        assert _span_ids(fake_pool) == [span.span_id for span in spans[2:]]
+
+    event_loop_runner.run(scenario())
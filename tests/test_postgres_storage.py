@@ -0,0 +1,100 @@
+import asyncio
+from datetime import datetime, timezone
+
+from mcp_observatory.proposal_commit.storage import SAVE_COMMIT_SQL, SAVE_PROPOSAL_SQL, PostgresStorage
+
+
+def _storage(pool) -> PostgresStorage:
+    storage = PostgresStorage("postgresql://unused", write_interval=0.001, retry_backoff=0.001)
+    storage.pool = pool
+    return storage
+
+
+def _proposal_ids(pool) -> list[str]:
+    return [row[0] for row in pool.rows(SAVE_PROPOSAL_SQL)]
+
+
+async def _save_proposal(storage: PostgresStorage, proposal_id: str) -> None:
+    await storage.save_proposal(
+        proposal_id=proposal_id,
+        tool_name="transfer_funds",
+        args_json="{}",
+        prompt_hash="h",
+        composite_score=0.1,
+        decision="allow",
+        created_at=datetime.now(timezone.utc),
+    )
+
+
+def test_rejected_proposal_does_not_stall_later_rows(event_loop_runner: asyncio.Runner, fake_pool, wait_for) -> None:
+    async def scenario() -> None:
+        fake_pool.rejected = frozenset({"dup"})
+        storage = _storage(fake_pool)
+        for proposal_id in ("p1", "dup", "p2"):
+            await _save_proposal(storage, proposal_id)
+
+        await wait_for(lambda: _proposal_ids(fake_pool) == ["p1", "p2"])
+        await _save_proposal(storage, "p3")
+        await wait_for(lambda: _proposal_ids(fake_pool) == ["p1", "p2", "p3"])
+        assert [p["proposal_id"] for p in storage.rejected_proposals] == ["dup"]
+        await storage.close()
+
+    event_loop_runner.run(scenario())
+
+
+def test_proposal_flush_retries_after_connection_errors(event_loop_runner: asyncio.Runner, fake_pool, wait_for) -> None:
+    async def scenario() -> None:
+        fake_pool.failures = 2
+        storage = _storage(fake_pool)
+        await _save_proposal(storage, "p1")
+
+        assert (await storage.get_proposal("p1"))["proposal_id"] == "p1"
+        await wait_for(lambda: _proposal_ids(fake_pool) == ["p1"])
+
+        # The flush loop is still running: a later proposal is written without close().
+        await _save_proposal(storage, "p2")
+        await wait_for(lambda: _proposal_ids(fake_pool) == ["p1", "p2"])
+        await storage.close()
+
+    event_loop_runner.run(scenario())
+
+
+def test_proposals_stay_visible_while_flushes_overlap(event_loop_runner: asyncio.Runner, fake_pool, wait_for) -> None:
+    async def scenario() -> None:
+        fake_pool.gate = asyncio.Event()
+        storage = _storage(fake_pool)
+        await _save_proposal(storage, "p1")
+        await wait_for(lambda: fake_pool.waiting == 1)
+
+        # An explicit flush while the background flush is still writing p1.
+        await _save_proposal(storage, "p2")
+        explicit_flush = asyncio.create_task(storage.flush())
+        await asyncio.sleep(0.005)
+
+        assert (await storage.get_proposal("p1"))["proposal_id"] == "p1"
+        assert (await storage.get_proposal("p2"))["proposal_id"] == "p2"
+
+        fake_pool.gate.set()
+        await explicit_flush
+        await wait_for(lambda: _proposal_ids(fake_pool) == ["p1", "p2"])
+        await storage.close()
+
+    event_loop_runner.run(scenario())
+
+
+def test_commit_rows_are_written_synchronously(event_loop_runner: asyncio.Runner, fake_pool) -> None:
+    async def scenario() -> None:
+        storage = _storage(fake_pool)
+        await storage.save_commit(
+            commit_id="c1",
+            proposal_id="p1",
+            token_id="t1",
+            decision="commit",
+            verification_reason="ok",
+            created_at=datetime.now(timezone.utc),
+        )
+
+        assert [row[0] for row in fake_pool.rows(SAVE_COMMIT_SQL)] == ["c1"]
+        await storage.close()
+
+    event_loop_runner.run(scenario())
@@ -64,6 +64,23 @@ def test_generic_proposer_supports_any_tool_name() -> None:
     asyncio.run(run())
 
 
+def test_propose_sync_matches_async_flow_for_in_memory_storage() -> None:
+    storage = InMemoryStorage()
+    proposer = ToolProposer(storage=storage, token_manager=CommitTokenManager(secret="unit-secret"))
+
+    result = proposer.propose_sync(
+        tool_name="place_trade",
+        tool_args={"symbol": "AAPL", "qty": 2},
+        prompt="Place trade for AAPL qty 2",
+        candidate_output_a="Trade plan qty 2",
+        candidate_output_b="Trade plan qty 2",
+    )
+
+    assert result["status"] == "allowed"
+    assert result["proposal_id"] in storage.proposals
+    assert storage.baseline["place_trade"] == storage.proposals[result["proposal_id"]]["prompt_hash"]
+
+
 def test_replay_protection_blocks_second_commit() -> None:
     async def run() -> None:
         server = DemoToolServer()
@@ -2,6 +2,7 @@ import asyncio
 
 from mcp_observatory.demo.real_world_server import build_real_world_scenarios, run_end_to_end_scenarios
 from mcp_observatory.policy.registry import DEFAULT_REGISTRY
+from mcp_observatory.policy.types import Criticality
 
 
 def test_build_real_world_scenarios_has_10_entries() -> None:
@@ -11,7 +12,7 @@ def test_build_real_world_scenarios_has_10_entries() -> None:
 
     for scenario in scenarios:
         profile = DEFAULT_REGISTRY.get(scenario.tool_name)
-        if profile.criticality.value == "HIGH":
+        if profile.criticality == Criticality.HIGH:
             assert scenario.secondary_llm_response is None
         if profile.irreversible:
             assert scenario.secondary_llm_response is None
@@ -1,11 +1,24 @@
 import asyncio
+import json
+from types import MappingProxyType
 
+import pytest
+
+from mcp_observatory.core.interceptor import MCPInterceptor
 from mcp_observatory.fallback.router import FallbackRouter
 from mcp_observatory.instrument import instrument
-from mcp_observatory.policy.registry import DEFAULT_REGISTRY, tool_profile
+from mcp_observatory.policy.registry import ToolRegistry, tool_profile
+from mcp_observatory.utils.hashing import args_hash
+
+# Module-local registry: nothing here touches DEFAULT_REGISTRY, so xdist
+# workers and other test modules never see these profiles.
+_REGISTRY = ToolRegistry()
 
+# Hoisted, read-only tool args, as a benchmark loop would pass them.
+_ARGS = MappingProxyType({"amount": 1200.0, "destination": "acct-1"})
 
-@tool_profile(criticality="HIGH", irreversible=True, regulatory=True, risk_tier="HIGH", registry=DEFAULT_REGISTRY)
+
+@tool_profile(criticality="HIGH", irreversible=True, regulatory=True, risk_tier="HIGH", registry=_REGISTRY)
 async def execute_transfer(*, amount: float, destination: str) -> dict:
     return {"status": "executed", "amount": amount, "destination": destination}
 
@@ -14,15 +27,106 @@ async def draft_transfer(tool_args: dict) -> dict:
     return {"status": "draft_created", **tool_args}
 
 
-def test_v2_blocks_and_uses_deterministic_fallback() -> None:
-    async def run() -> None:
-        router = FallbackRouter()
-        router.register("execute_transfer", draft_transfer)
-        interceptor = instrument("unit-test", fallback_router=router)
+@pytest.fixture(scope="module")
+def registry() -> ToolRegistry:
+    return _REGISTRY
+
+
+@pytest.fixture(scope="module")
+def interceptor(registry: ToolRegistry) -> MCPInterceptor:
+    router = FallbackRouter()
+    router.register("execute_transfer", draft_transfer)
+    return instrument("unit-test", tool_registry=registry, fallback_router=router)
+
+
+@pytest.mark.parametrize(
+    "case",
+    [
+        {
+            "amount": 1200.0,
+            "destination": "acct-1",
+            "prompt": "transfer now",
+            "answer": "transfer completed successfully",
+            "secondary": "transfer maybe complete",
+            "context": "transfer declined due to issuer block",
+            "summary": "payment API failed: declined",
+            "expected_status": "draft_created",
+        },
+        {
+            "amount": 50.0,
+            "destination": "acct-2",
+            "prompt": "transfer 50 to acct-2",
+            "answer": "transfer of 50 to acct-2 completed",
+            "secondary": "transfer of 50 to acct-2 completed",
+            "context": "transfer of 50 to acct-2 completed",
+            "summary": "payment API success: processed",
+            "expected_status": "executed",
+        },
+    ],
+    ids=["blocked-uses-fallback", "grounded-executes"],
+)
+def test_v2_fallback_behavior(
+    event_loop_runner: asyncio.Runner, interceptor: MCPInterceptor, case: dict
+) -> None:
+    result = event_loop_runner.run(
+        interceptor.intercept_tool_call(
+            tool_name="execute_transfer",
+            tool_args={"amount": case["amount"], "destination": case["destination"]},
+            tool_fn=execute_transfer,
+            prompt=case["prompt"],
+            model_answer=case["answer"],
+            secondary_answer=case["secondary"],
+            retrieved_context=case["context"],
+            tool_result_summary=case["summary"],
+            prompt_template_id="transfer-v2",
+        )
+    )
+
+    assert result["status"] == case["expected_status"]
+
+
+@pytest.mark.parametrize(
+    ("fast_path_on_block", "expected_status"),
+    [(True, "draft_created"), (False, "executed")],
+    ids=["fast-path-routes-to-fallback", "slow-path-scores-risk"],
+)
+def test_v2_fast_path_on_block(
+    event_loop_runner: asyncio.Runner, registry: ToolRegistry, fast_path_on_block: bool, expected_status: str
+) -> None:
+    router = FallbackRouter()
+    router.register("execute_transfer", draft_transfer)
+    interceptor = instrument(
+        "unit-test-fast-path",
+        tool_registry=registry,
+        fallback_router=router,
+        fast_path_on_block=fast_path_on_block,
+    )
+
+    # A grounded, consistent answer that the full policy path would allow.
+    result = event_loop_runner.run(
+        interceptor.intercept_tool_call(
+            tool_name="execute_transfer",
+            tool_args={"amount": 50.0, "destination": "acct-2"},
+            tool_fn=execute_transfer,
+            prompt="transfer 50 to acct-2",
+            model_answer="transfer of 50 to acct-2 completed",
+            secondary_answer="transfer of 50 to acct-2 completed",
+            retrieved_context="transfer of 50 to acct-2 completed",
+            tool_result_summary="payment API success: processed",
+            prompt_template_id="transfer-v2",
+        )
+    )
 
-        result = await interceptor.intercept_tool_call(
+    assert result["status"] == expected_status
+
+
+def test_v2_accepts_read_only_tool_args(event_loop_runner: asyncio.Runner, interceptor: MCPInterceptor) -> None:
+    assert args_hash(_ARGS) == args_hash(dict(_ARGS))
+
+    result = event_loop_runner.run(
+        interceptor.intercept_tool_call(
             tool_name="execute_transfer",
-            tool_args={"amount": 1200.0, "destination": "acct-1"},
+            tool_args=_ARGS,
             tool_fn=execute_transfer,
             prompt="transfer now",
             model_answer="transfer completed successfully",
@@ -31,7 +135,40 @@ def test_v2_blocks_and_uses_deterministic_fallback() -> None:
             tool_result_summary="payment API failed: declined",
             prompt_template_id="transfer-v2",
         )
+    )
+
+    assert result == {"status": "draft_created", "amount": 1200.0, "destination": "acct-1"}
+
+
+def test_v2_block_template_is_a_fresh_json_dict(event_loop_runner: asyncio.Runner, registry: ToolRegistry) -> None:
+    interceptor = instrument("unit-test-template", tool_registry=registry, fallback_router=FallbackRouter())
+
+    def call() -> dict:
+        return event_loop_runner.run(
+            interceptor.intercept_tool_call(
+                tool_name="execute_transfer",
+                tool_args=_ARGS,
+                tool_fn=execute_transfer,
+                prompt="transfer now",
+                model_answer="transfer completed successfully",
+                secondary_answer="transfer maybe complete",
+                retrieved_context="transfer declined due to issuer block",
+                tool_result_summary="payment API failed: declined",
+                prompt_template_id="transfer-v2",
+            )
+        )
+
+    first, second = call(), call()
+
+    assert type(first) is dict
+    assert json.loads(json.dumps(first))["status"] == "blocked"
+    first["status"] = "mutated"
+    assert second["status"] == "blocked"
+
 
-        assert result["status"] == "draft_created"
+def test_instrument_builds_independent_interceptors(registry: ToolRegistry) -> None:
+    first = instrument("unit-test-independent", tool_registry=registry)
+    second = instrument("unit-test-independent", tool_registry=registry)
 
-    asyncio.run(run())
+    assert first is not second
+    assert first.token_verifier is not second.token_verifier